@@ -141,17 +141,24 @@ class MomentumBot:
         await self._send_status_update()
         self.logger.info("Initial status update sent")
 
+        # Load instrument tokens up front, then stream spot/VIX over WebSocket (no-ops in demo mode)
+        await self.market_data.prefetch_instruments()
+        await self.market_data.start_ticker()
+
         while self.running:
             try:
+                # One clock read per tick, shared by the snapshot and any orders
+                now = datetime.now(self.market_data.tz)
+
                 # Check if market is open
-                if not self.market_data.is_market_open():
+                if not self.market_data.is_market_open(now):
                     self.logger.debug("Market closed - sleeping")
                     await asyncio.sleep(60)
                     continue
 
                 # Fetch latest market data
                 self.logger.debug("Fetching market data...")
-                data = await self.market_data.get_latest()
+                data = await self.market_data.get_latest(now)
 
                 # CRITICAL: Check with master controller
                 can_trade, reason = self.master_controller.should_bot_3_trade(data)
@@ -254,7 +261,7 @@ class MomentumBot:
             return
 
         # Execute order
-        order_result = await self.broker.place_order(position)
+        order_result = await self.broker.place_order(position, now=data['timestamp'])
 
         if order_result.get('success'):
             self.logger.info(f"✅ Position opened: {position['position_id']}")
@@ -310,7 +317,8 @@ class MomentumBot:
                     close_result = await self.broker.close_position(
                         position,
                         exit_quantity,
-                        current_premium
+                        current_premium,
+                        now=data['timestamp']
                     )
 
                     if close_result.get('success'):
@@ -321,6 +329,13 @@ class MomentumBot:
                             current_premium
                         )
 
+                        if not result.get('success'):
+                            self.logger.warning(
+                                f"Exit not recorded: {position['position_id']} | "
+                                f"Reason={result.get('reason')}"
+                            )
+                            continue
+
                         # Log and notify
                         self.trade_logger.log_exit(position, result, exit_signal['reason'])
                         await self.telegram.send_position_closed(
@@ -375,10 +390,14 @@ class MomentumBot:
         self.logger.info("Shutting down MCH Bot 3.0...")
 
         self.running = False
+        self.market_data.stop_ticker()
 
         # Send final status
         await self._send_status_update()
         await self.telegram.send_alert('shutdown', 'MCH Bot 3.0 stopped')
+        await self.telegram.close()
+        self.trade_logger.close()
+        self.broker.close()
 
         self.logger.info("✅ Shutdown complete")
 
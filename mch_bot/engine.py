@@ -20,6 +20,7 @@ from .strategy.iron_condor import (
     ICParams,
     ICConstraints,
     build_iron_condor_balanced,
+    make_strike_selector,
     validate_balanced_ic,
 )
 from .risk.position import PositionSizing
@@ -447,6 +448,7 @@ def run_live(cfg: Config, force_dry_run: bool = False) -> None:
 
     best_ic = None
     best_err = 1e9
+    select_strikes = make_strike_selector(step, wing)
     for dist in range(int(cfg.get("strategy.min_otm_distance", 200)), int(cfg.get("strategy.max_otm_distance", 500)) + 1, int(step)):
         cand = build_iron_condor_balanced(
             spot=spot,
@@ -458,6 +460,7 @@ def run_live(cfg: Config, force_dry_run: bool = False) -> None:
             expiry_t=t_years,
             r=r,
             iv=sigma,
+            selector=select_strikes,
         )
         if not cand.legs:
             continue
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import logging
+import mmap
 import os
 import threading
 import time
+from collections import defaultdict
 from queue import Queue, Empty
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-import requests
 from apscheduler.schedulers.background import BackgroundScheduler
 
+from .telegram_http import JSON_HEADERS, SESSION, send_url
+from .utils import jsonio
+
 
 log = logging.getLogger("notifications")
 
@@ -20,6 +25,82 @@ def _env(name: str, default: Optional[str] = None) -> Optional[str]:
     return v if v is not None else default
 
 
+_ENTRY_TMPL = (
+    "🎯 <b>IRON CONDOR ENTERED</b>\n"
+    "⏰ {time_str} | 📈 NIFTY: {spot:.2f}\n\n"
+    "🛡️ <b>STRUCTURE</b>:\n"
+    "• SELL {short_put} PE\n"
+    "• BUY {long_put} PE\n"
+    "• SELL {short_call} CE\n"
+    "• BUY {long_call} CE\n\n"
+    "💰 <b>CREDIT:</b> ₹{credit_rupees:,.0f} ({credit_pts:.0f} pts)\n"
+    "🎯 <b>TARGET:</b> ₹{target_rupees:,.0f} (50%)\n"
+    "🛑 <b>STOP LOSS:</b> ₹{sl_rupees:,.0f} (100%)\n"
+    "⏳ <b>COOLDOWN:</b> {cooldown} min after exit"
+)
+
+_EXIT_TMPL = (
+    "✅ <b>TRADE CLOSED - PROFIT</b>\n"
+    "⏰ {time_str} | 🕐 Duration: {duration}\n\n"
+    "📊 <b>PERFORMANCE</b>:\n"
+    "• Entry: ₹{entry_rupees:,.0f} credit\n"
+    "• Exit: ₹{exit_rupees:,.0f} debit\n"
+    "• P&L: ₹{pnl_rupees:,.0f} (+{pnl_pct:.1f}%)\n"
+    "• Reason: {reason}\n\n"
+    "⏳ Next trade available: {next_ready}"
+)
+
+
+def _load_trades(path: Path, dates: Sequence[str]) -> List[Dict[str, Any]]:
+    """Read trade records whose ``date_local`` is in ``dates``.
+
+    The file is memory-mapped and scanned line by line; only lines containing
+    one of the date strings are JSON-decoded.
+    """
+    trades: List[Dict[str, Any]] = []
+    try:
+        if path.stat().st_size == 0:
+            return trades
+    except OSError:
+        return trades
+    wanted = set(dates)
+    needles = [d.encode() for d in wanted]
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for line in iter(mm.readline, b''):
+            if not any(n in line for n in needles):
+                continue
+            try:
+                rec = jsonio.loads(line)
+            except Exception:
+                continue
+            if rec.get('date_local') in wanted:
+                trades.append(rec)
+    return trades
+
+
+def _summarize_pnl(trades: List[Dict[str, Any]]) -> Tuple[float, int, int, Optional[float], Optional[float]]:
+    """Single pass over trade records -> (total, wins, losses, best, worst) P&L."""
+    pnl_total = 0.0
+    wins = losses = 0
+    best_p: Optional[float] = None
+    worst_p: Optional[float] = None
+    for t in trades:
+        raw = t.get('pnl_rupees')
+        if raw is None:
+            continue
+        p = float(raw)
+        pnl_total += p
+        if p > 0:
+            wins += 1
+        else:
+            losses += 1
+        if best_p is None or p > best_p:
+            best_p = p
+        if worst_p is None or p < worst_p:
+            worst_p = p
+    return pnl_total, wins, losses, best_p, worst_p
+
+
 @dataclass
 class NotificationConfig:
     enabled: bool = True
@@ -47,6 +128,17 @@ class NotificationManager:
         self._thread = threading.Thread(target=self._worker, name="notif-worker", daemon=True)
         self._started = False
         self._scheduler: Optional[BackgroundScheduler] = None
+        # Resolve timezones once; scheduled jobs reuse them on every run
+        try:
+            from zoneinfo import ZoneInfo
+            self._tz: Optional[Any] = ZoneInfo(config.tz)
+        except Exception:
+            self._tz = None  # datetime.now(None) -> local time
+        try:
+            from pytz import timezone  # optional; falls back to string tz if unavailable
+            self._sched_tz: Any = timezone(config.tz)
+        except Exception:
+            self._sched_tz = config.tz
 
     def start(self) -> None:
         if self._started:
@@ -74,12 +166,7 @@ class NotificationManager:
         self._enqueue(msg)
 
     def schedule_reports(self) -> None:
-        try:
-            from pytz import timezone  # optional; falls back to string tz if unavailable
-            tz = timezone(self.config.tz)
-        except Exception:
-            tz = self.config.tz
-        self._scheduler = BackgroundScheduler(timezone=tz)
+        self._scheduler = BackgroundScheduler(timezone=self._sched_tz)
         if self.config.daily_summary:
             self._scheduler.add_job(self._daily_summary, 'cron', hour=16, minute=0, id='daily')
         if self.config.weekly_report:
@@ -109,12 +196,12 @@ class NotificationManager:
     def _send_telegram_message(self, message: str, parse_mode: str = 'HTML') -> None:
         if not self.bot_token or not self.chat_id:
             return
-        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
-        payload = {"chat_id": int(self.chat_id), "text": message, "parse_mode": parse_mode}
+        url = send_url(self.bot_token)
+        body = jsonio.dumps({"chat_id": int(self.chat_id), "text": message, "parse_mode": parse_mode})
         backoff = 1.0
         for attempt in range(self.config.retry_attempts):
             try:
-                resp = requests.post(url, json=payload, timeout=10)
+                resp = SESSION.post(url, data=body, headers=JSON_HEADERS, timeout=10)
                 if resp.status_code == 200:
                     return
                 log.warning(f"Telegram send attempt {attempt+1} failed: {resp.status_code} {resp.text}")
@@ -127,49 +214,14 @@ class NotificationManager:
     def _format_immediate(self, alert_type: str, d: Dict[str, Any]) -> Optional[str]:
         try:
             if alert_type == 'entry':
-                t = d.get('time_str', '')
-                spot = d.get('spot')
-                sp = d.get('short_put')
-                pl = d.get('long_put')
-                sc = d.get('short_call')
-                cl = d.get('long_call')
-                credit_rupees = d.get('credit_rupees')
-                credit_pts = d.get('credit_pts')
-                target_rupees = d.get('target_rupees')
-                sl_rupees = d.get('sl_rupees')
-                cooldown = d.get('cooldown')
-                return (
-                    f"🎯 <b>IRON CONDOR ENTERED</b>\n"
-                    f"⏰ {t} | 📈 NIFTY: {spot:.2f}\n\n"
-                    f"🛡️ <b>STRUCTURE</b>:\n"
-                    f"• SELL {int(sp)} PE\n"
-                    f"• BUY {int(pl)} PE\n"
-                    f"• SELL {int(sc)} CE\n"
-                    f"• BUY {int(cl)} CE\n\n"
-                    f"💰 <b>CREDIT:</b> ₹{credit_rupees:,.0f} ({credit_pts:.0f} pts)\n"
-                    f"🎯 <b>TARGET:</b> ₹{target_rupees:,.0f} (50%)\n"
-                    f"🛑 <b>STOP LOSS:</b> ₹{sl_rupees:,.0f} (100%)\n"
-                    f"⏳ <b>COOLDOWN:</b> {cooldown} min after exit"
-                )
+                fields = defaultdict(str, d)
+                for k in ('short_put', 'long_put', 'short_call', 'long_call'):
+                    fields[k] = int(d.get(k))
+                return _ENTRY_TMPL.format_map(fields)
             if alert_type == 'exit':
-                t = d.get('time_str', '')
-                duration = d.get('duration', '')
-                entry_rupees = d.get('entry_rupees')
-                exit_rupees = d.get('exit_rupees')
-                pnl_rupees = d.get('pnl_rupees')
-                pnl_pct = d.get('pnl_pct')
-                reason = d.get('reason', 'Closed')
-                next_ready = d.get('next_ready', '')
-                return (
-                    f"✅ <b>TRADE CLOSED - PROFIT</b>\n"
-                    f"⏰ {t} | 🕐 Duration: {duration}\n\n"
-                    f"📊 <b>PERFORMANCE</b>:\n"
-                    f"• Entry: ₹{entry_rupees:,.0f} credit\n"
-                    f"• Exit: ₹{exit_rupees:,.0f} debit\n"
-                    f"• P&L: ₹{pnl_rupees:,.0f} (+{pnl_pct:.1f}%)\n"
-                    f"• Reason: {reason}\n\n"
-                    f"⏳ Next trade available: {next_ready}"
-                )
+                fields = defaultdict(str, d)
+                fields.setdefault('reason', 'Closed')
+                return _EXIT_TMPL.format_map(fields)
         except Exception as e:
             log.warning(f"Immediate alert formatting failed: {e}")
         return None
@@ -178,31 +230,12 @@ class NotificationManager:
     def _daily_summary(self) -> None:
         # Summarize today's trades from .runtime/trades.jsonl
         try:
-            from pathlib import Path
-            import json
             from datetime import datetime
             # Get local date in configured tz
-            try:
-                from zoneinfo import ZoneInfo
-                today_local = datetime.now(ZoneInfo(self.config.tz)).strftime('%Y-%m-%d')
-            except Exception:
-                today_local = datetime.now().strftime('%Y-%m-%d')
-            trades_path = Path('.runtime/trades.jsonl')
-            trades = []
-            if trades_path.exists():
-                for line in trades_path.read_text(encoding='utf-8').splitlines():
-                    try:
-                        rec = json.loads(line)
-                        if rec.get('date_local') == today_local:
-                            trades.append(rec)
-                    except Exception:
-                        continue
+            today_local = datetime.now(self._tz).strftime('%Y-%m-%d')
+            trades = _load_trades(Path('.runtime/trades.jsonl'), (today_local,))
             count = len(trades)
-            pnl_total = sum(float(t.get('pnl_rupees', 0.0)) for t in trades)
-            wins = sum(1 for t in trades if float(t.get('pnl_rupees', 0.0)) > 0)
-            losses = sum(1 for t in trades if float(t.get('pnl_rupees', 0.0)) <= 0 and t.get('pnl_rupees') is not None)
-            best = max(trades, key=lambda t: float(t.get('pnl_rupees', -1e18)), default=None)
-            worst = min(trades, key=lambda t: float(t.get('pnl_rupees', 1e18)), default=None)
+            pnl_total, wins, losses, best_p, worst_p = _summarize_pnl(trades)
             msg = [
                 f"📊 <b>DAILY PERFORMANCE - {today_local}</b>",
                 "🕔 4:00 PM Report\n",
@@ -210,40 +243,23 @@ class NotificationManager:
                 f"✅ Wins: {wins} | ❌ Losses: {losses}",
                 f"💰 Total P&L: ₹{pnl_total:,.0f}",
             ]
-            if best:
-                msg.append(f"🏆 Best Trade: ₹{float(best.get('pnl_rupees', 0.0)):,.0f}")
-            if worst:
-                msg.append(f"📉 Worst Trade: ₹{float(worst.get('pnl_rupees', 0.0)):,.0f}")
+            if best_p is not None:
+                msg.append(f"🏆 Best Trade: ₹{best_p:,.0f}")
+            if worst_p is not None:
+                msg.append(f"📉 Worst Trade: ₹{worst_p:,.0f}")
             self._enqueue("\n".join(msg))
         except Exception as e:
             log.warning(f"Daily summary failed: {e}")
 
     def _weekly_report(self) -> None:
         try:
-            from pathlib import Path
-            import json
             from datetime import datetime, timedelta
             # Range: last 7 days local
-            try:
-                from zoneinfo import ZoneInfo
-                now_local = datetime.now(ZoneInfo(self.config.tz))
-            except Exception:
-                now_local = datetime.now()
+            now_local = datetime.now(self._tz)
             days = [(now_local - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(7)]
-            trades_path = Path('.runtime/trades.jsonl')
-            trades = []
-            if trades_path.exists():
-                for line in trades_path.read_text(encoding='utf-8').splitlines():
-                    try:
-                        rec = json.loads(line)
-                        if rec.get('date_local') in days:
-                            trades.append(rec)
-                    except Exception:
-                        continue
+            trades = _load_trades(Path('.runtime/trades.jsonl'), days)
             count = len(trades)
-            pnl_total = sum(float(t.get('pnl_rupees', 0.0)) for t in trades)
-            wins = sum(1 for t in trades if float(t.get('pnl_rupees', 0.0)) > 0)
-            losses = sum(1 for t in trades if float(t.get('pnl_rupees', 0.0)) <= 0 and t.get('pnl_rupees') is not None)
+            pnl_total, wins, losses, _, _ = _summarize_pnl(trades)
             msg = (
                 f"📋 <b>WEEKLY REPORT</b>\n"
                 f"Days: {days[-1]} ➜ {days[0]}\n\n"
@@ -4,7 +4,7 @@ import re
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 from .config import load_config, Config
 from .utils.log_parser import LogParser, TradeRecord, Decision
@@ -36,14 +36,62 @@ class Response:
         return "\n".join(parts)
 
 
+class _SimParams(NamedTuple):
+    spot: float
+    iv: float
+    r: float
+    step: float
+    lot: int
+    width: float
+    target_distance: float
+    target_delta: float
+    min_credit: float
+    min_days: float
+
+
+def _sim_params_from(cfg: Config) -> _SimParams:
+    return _SimParams(
+        spot=float(cfg.get("demo.spot", 23500)),
+        iv=float(cfg.get("demo.iv", 0.18)),
+        r=float(cfg.get("backtest.risk_free_rate", 0.06)),
+        step=float(cfg.get("instrument.strike_step", 50)),
+        lot=int(cfg.get("instrument.lot_size", 75)),
+        width=float(cfg.get("strategy.wing_width_points", 400)),
+        target_distance=float(cfg.get("strategy.target_distance_points", 300)),
+        target_delta=float(cfg.get("strategy.target_delta", 0.15)),
+        min_credit=float(cfg.get("strategy.min_credit_per_ic", 1)),
+        min_days=float(cfg.get("strategy.min_days_to_expiry", 2)),
+    )
+
+
+# Parsed config (and its simulation inputs, filled on first use) per path, keyed on
+# mtime: CLI and Telegram build a QueryEngine per query, so the YAML is only
+# re-read when the file changes.
+_CONFIG_CACHE: Dict[Path, Tuple[int, Config, List[Optional[_SimParams]]]] = {}
+
+
+def _cached_config(path: Path) -> Optional[Tuple[Config, List[Optional[_SimParams]]]]:
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    hit = _CONFIG_CACHE.get(path)
+    if hit is None or hit[0] != mtime:
+        hit = (mtime, load_config(path), [None])
+        _CONFIG_CACHE[path] = hit
+    return hit[1], hit[2]
+
+
 class QueryEngine:
     def __init__(self, log_dir: str = "logs/", config_path: str = "config.yaml") -> None:
         self.log_dir = Path(log_dir)
         self.parser = LogParser(self.log_dir)
         self.config_path = Path(config_path)
         self.cfg: Optional[Config] = None
-        if self.config_path.exists():
-            self.cfg = load_config(self.config_path)
+        self._sim_slot: List[Optional[_SimParams]] = [None]
+        cached = _cached_config(self.config_path)
+        if cached is not None:
+            self.cfg, self._sim_slot = cached
 
     def parse_question(self, user_input: str) -> Dict[str, Any]:
         q = user_input.strip().lower()
@@ -139,25 +187,31 @@ class QueryEngine:
             rows = rows[: int(n)]
         return Response(text=Response.format_table(rows))
 
+    @property
+    def _sim_params(self) -> _SimParams:
+        """Simulation inputs, computed once per loaded config file version."""
+        if self._sim_slot[0] is None:
+            self._sim_slot[0] = _sim_params_from(self.cfg)
+        return self._sim_slot[0]
+
     def handle_simulation_query(self, scenario: Dict[str, Any]) -> Response:
         if self.cfg is None:
             return Response(text="Missing config.yaml; cannot simulate.")
-        spot = scenario.get("spot") or float(self.cfg.get("demo.spot", 23500))
-        iv = float(self.cfg.get("demo.iv", 0.18))
-        r = float(self.cfg.get("backtest.risk_free_rate", 0.06))
-        step = float(self.cfg.get("instrument.strike_step", 50))
-        lot = int(self.cfg.get("instrument.lot_size", 75))
-        width = float(self.cfg.get("strategy.wing_width_points", 400))
-        target_distance = float(self.cfg.get("strategy.target_distance_points", 300))
+        p = self._sim_params
+        spot = scenario.get("spot") or p.spot
+        iv = p.iv
+        width = p.width
+        target_distance = p.target_distance
+        lot = p.lot
         ic = build_iron_condor_balanced(
             spot=spot,
             lot_size=lot,
-            step=step,
-            params=ICParams(target_delta=float(self.cfg.get("strategy.target_delta", 0.15)), wing_width_points=width, min_credit_per_ic=float(self.cfg.get("strategy.min_credit_per_ic", 1))),
+            step=p.step,
+            params=ICParams(target_delta=p.target_delta, wing_width_points=width, min_credit_per_ic=p.min_credit),
             target_distance=target_distance,
             price_fn=black_scholes,
-            expiry_t=max(1/252, float(self.cfg.get("strategy.min_days_to_expiry", 2)) / 252.0),
-            r=r,
+            expiry_t=max(1/252, p.min_days / 252.0),
+            r=p.r,
             iv=iv,
         )
         if not ic.legs:
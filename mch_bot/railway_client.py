@@ -1,13 +1,37 @@
 from __future__ import annotations
 
-import os
 import logging
-from typing import Optional, Dict, Any
+import threading
+from typing import Dict, Any, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 log = logging.getLogger(__name__)
 
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _session() -> requests.Session:
+    """Shared keep-alive session; env update + restart reuse one TLS connection."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                retry = Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["PATCH", "POST"],
+                    raise_on_status=False,
+                )
+                s = requests.Session()
+                s.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry))
+                _SESSION = s
+    return _SESSION
+
 
 def update_env_variable(service_id: str, token: str, variables: Dict[str, Any]) -> bool:
     """Update Railway service variables via REST API.
@@ -18,7 +42,7 @@ def update_env_variable(service_id: str, token: str, variables: Dict[str, Any])
         url = f"https://backboard.railway.app/v1/services/{service_id}/variables"
         headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
         payload = {"variables": variables}
-        resp = requests.patch(url, json=payload, headers=headers, timeout=15)
+        resp = _session().patch(url, json=payload, headers=headers, timeout=15)
         if resp.status_code // 100 == 2:
             return True
         log.warning(f"Railway env update failed: {resp.status_code} {resp.text}")
@@ -43,7 +67,7 @@ def restart_railway_service(service_id: str, token: str) -> bool:
             "variables": {"serviceId": service_id}
         }
 
-        resp = requests.post(url, json=payload, headers=headers, timeout=30)
+        resp = _session().post(url, json=payload, headers=headers, timeout=30)
 
         if resp.status_code // 100 == 2:
             data = resp.json()
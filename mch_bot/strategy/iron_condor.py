@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Callable, List, Optional, Tuple
 
 
 @dataclass
@@ -53,29 +53,37 @@ def pick_strikes_by_delta(spot: float, step: float, target_delta: float) -> Tupl
     return put_strike, call_strike
 
 
+StrikeSelector = Callable[[float, float], Tuple[float, float, float, float]]
+
+
+def make_strike_selector(step: float, wing_width: float) -> StrikeSelector:
+    """Bind step/wing once and return ``select(spot, target_distance)``.
+
+    The returned closure yields ``(short_put, long_put, short_call, long_call)``
+    exactly like :func:`select_balanced_strikes_by_distance`, without redoing
+    the wing fallback on every call of a distance scan.
+    """
+    if wing_width <= 0:
+        wing_width = step * 2
+
+    def select(spot: float, target_distance: float) -> Tuple[float, float, float, float]:
+        # Ensure target distance positive and wings equal
+        if target_distance <= 0:
+            target_distance = step
+        short_put = float(int((spot - target_distance) // step) * step)
+        short_call = float(int((spot + target_distance + step - 1) // step) * step)
+        return short_put, short_put - wing_width, short_call, short_call + wing_width
+
+    return select
+
+
 def select_balanced_strikes_by_distance(
     spot: float,
     step: float,
     target_distance: float,
     wing_width: float,
 ) -> Tuple[float, float, float, float]:
-    # Ensure target distance positive and wings equal
-    if target_distance <= 0:
-        target_distance = step
-    if wing_width <= 0:
-        wing_width = step * 2
-
-    def round_to_down(x: float, step: float) -> float:
-        return (int(x // step)) * step
-
-    def round_to_up(x: float, step: float) -> float:
-        return (int((x + step - 1) // step)) * step
-
-    short_put = round_to_down(spot - target_distance, step)
-    short_call = round_to_up(spot + target_distance, step)
-    long_put = short_put - wing_width
-    long_call = short_call + wing_width
-    return float(short_put), float(long_put), float(short_call), float(long_call)
+    return make_strike_selector(step, wing_width)(spot, target_distance)
 
 
 def validate_balanced_ic(
@@ -169,8 +177,12 @@ def build_iron_condor_balanced(
     expiry_t: float,
     r: float,
     iv: float,
+    selector: Optional[StrikeSelector] = None,
 ) -> IronCondor:
-    sp, lp, sc, lc = select_balanced_strikes_by_distance(spot, step, target_distance, params.wing_width_points)
+    if selector is not None:
+        sp, lp, sc, lc = selector(spot, target_distance)
+    else:
+        sp, lp, sc, lc = select_balanced_strikes_by_distance(spot, step, target_distance, params.wing_width_points)
 
     ps = price_fn(spot, sp, expiry_t, r, iv, "PUT")
     pl = price_fn(spot, lp, expiry_t, r, iv, "PUT")
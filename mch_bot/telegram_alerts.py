@@ -1,65 +1,109 @@
 from __future__ import annotations
 
-import json
 import os
 import re
 import threading
 import time
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 
-import requests
+from .telegram_http import send_message
+from .utils import jsonio
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags  # optional, Linux only
+except ImportError:
+    INotify = None
 
 
 SECRETS_DIR = Path('.secrets')
 TELEGRAM_FILE = SECRETS_DIR / 'telegram.json'
 
 
+def _telegram_file_mtime() -> int:
+    try:
+        return TELEGRAM_FILE.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _coerce_ids(xs: Iterable[object]) -> List[int]:
+    """Parse chat ids, skipping blanks and non-integers; sorted and de-duplicated."""
+    out: set[int] = set()
+    for x in xs:
+        x = str(x).strip()
+        if not x:
+            continue
+        try:
+            out.add(int(x))
+        except ValueError:
+            pass
+    return sorted(out)
+
+
 def _load_token_and_chats() -> tuple[Optional[str], List[int]]:
     token = os.getenv('TELEGRAM_BOT_TOKEN')
-    chats: List[int] = []
+    raw: List[object] = []
 
     if TELEGRAM_FILE.exists():
         try:
-            data = json.loads(TELEGRAM_FILE.read_text(encoding='utf-8'))
+            data = jsonio.loads(TELEGRAM_FILE.read_bytes())
             token = token or data.get('bot_token')
-            chats = [int(x) for x in data.get('allowed_chat_ids', []) if str(x).strip()]
+            raw.extend(data.get('allowed_chat_ids', []))
         except Exception:
             pass
 
     env_ids = os.getenv('TELEGRAM_ALLOWED_IDS')
     if env_ids:
-        for x in env_ids.split(','):
-            x = x.strip()
-            if not x:
-                continue
-            try:
-                chats.append(int(x))
-            except Exception:
-                pass
+        raw.extend(env_ids.split(','))
     one = os.getenv('TELEGRAM_CHAT_ID')
     if one:
-        try:
-            chats.append(int(one))
-        except Exception:
-            pass
+        raw.append(one)
 
-    chats = sorted(list({int(x) for x in chats}))
-    return token, chats
+    return token, _coerce_ids(raw)
 
 
 def _send_telegram_sync(token: str, chat_id: int, text: str, html: bool = True) -> bool:
-    try:
-        url = f"https://api.telegram.org/bot{token}/sendMessage"
-        payload = {'chat_id': chat_id, 'text': text}
-        if html:
-            payload['parse_mode'] = 'HTML'
-        resp = requests.post(url, json=payload, timeout=10)
-        return resp.status_code == 200
-    except Exception:
-        return False
+    return send_message(token, chat_id, text, html=html)
+
+
+# Sends run off the tail thread on one single-worker executor per chat: chats
+# go out in parallel while each chat still receives its messages in order.
+# The semaphore caps in-flight messages so an unreachable Telegram sheds
+# alerts instead of piling up futures
+_SEND_POOLS: Dict[int, ThreadPoolExecutor] = {}
+_SEND_POOLS_LOCK = threading.Lock()
+_SEND_SLOTS = threading.BoundedSemaphore(1000)
+
+
+def _submit(chat_id: int, fn, *args) -> Future:
+    pool = _SEND_POOLS.get(chat_id)
+    if pool is None:
+        with _SEND_POOLS_LOCK:
+            pool = _SEND_POOLS.get(chat_id)
+            if pool is None:
+                pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'tg-send-{chat_id}')
+                _SEND_POOLS[chat_id] = pool
+    return pool.submit(fn, *args)
+
+
+def _release_slot(_fut) -> None:
+    _SEND_SLOTS.release()
+
+
+def _fanout(token: str, chats: List[int], text: str) -> List[Future]:
+    futures: List[Future] = []
+    for cid in chats:
+        if not _SEND_SLOTS.acquire(blocking=False):
+            continue  # backlog full; drop
+        fut = _submit(cid, _send_telegram_sync, token, cid, text, True)
+        fut.add_done_callback(_release_slot)
+        futures.append(fut)
+    return futures
 
 
 def _fmt_time_12(dt: datetime) -> str:
@@ -114,42 +158,92 @@ class HourlyBuffer:
 
 
 def _ts_from_line(line: str) -> datetime:
-    # Expect lines like 'YYYY-MM-DD HH:MM:SS,ms LEVEL ...'
+    # Expect lines like 'YYYY-MM-DD HH:MM:SS,ms LEVEL ...'; fixed offsets, no generic ISO parse
     try:
-        prefix = line.split(' ', 2)[:2]
-        dt = datetime.fromisoformat(' '.join(prefix).replace(',', '.'))
-        return dt
+        if line[4] != '-' or line[7] != '-' or line[10] != ' ' or line[13] != ':' or line[16] != ':':
+            return datetime.now()
+        us = 0
+        if line[19:20] in (',', '.'):
+            frac = line[20:26].split(' ', 1)[0]
+            us = int(frac.ljust(6, '0'))
+        return datetime(
+            int(line[0:4]), int(line[5:7]), int(line[8:10]),
+            int(line[11:13]), int(line[14:16]), int(line[17:19]), us,
+        )
     except Exception:
         return datetime.now()
 
 
+def _build_scan_table() -> Tuple[Dict[str, Tuple[int, str, str]], re.Pattern]:
+    """Map each lower-cased pattern to (priority, scope, category) and compile one scanner.
+
+    Priority follows dict order (immediate before hourly), so a line matching several
+    patterns resolves exactly as the original nested substring loops did.
+    """
+    table: Dict[str, Tuple[int, str, str]] = {}
+    rank = 0
+    for scope, groups in (('immediate', IMMEDIATE_PATTERNS), ('hourly', HOURLY_PATTERNS)):
+        for cat, pats in groups.items():
+            for p in pats:
+                table.setdefault(p.lower(), (rank, scope, cat))
+            rank += 1
+    ordered = sorted(table, key=lambda k: table[k][0])
+    # Zero-width lookahead so overlapping matches at every offset are seen
+    scan = re.compile("(?=(" + "|".join(re.escape(p) for p in ordered) + "))", re.IGNORECASE)
+    return table, scan
+
+
+_PATTERN_MAP, _SCAN_RE = _build_scan_table()
+
+
 def _categorize(line: str) -> Tuple[Optional[str], Optional[str]]:
-    low = line.lower()
-    for cat, pats in IMMEDIATE_PATTERNS.items():
-        for p in pats:
-            if p.lower() in low:
-                return 'immediate', cat
-    for cat, pats in HOURLY_PATTERNS.items():
-        for p in pats:
-            if p.lower() in low:
-                return 'hourly', cat
-    return None, None
+    best: Optional[Tuple[int, str, str]] = None
+    for m in _SCAN_RE.finditer(line):
+        hit = _PATTERN_MAP[m.group(1).lower()]
+        if best is None or hit[0] < best[0]:
+            best = hit
+            if best[0] == 0:
+                break
+    if best is None:
+        return None, None
+    return best[1], best[2]
+
+
+_RE_AT_NUM = re.compile(r"@\s*([0-9]+(?:\.[0-9]+)?)")
+_RE_NAMED_AMOUNT = re.compile(r"\b(Credit|P&L|Profit|Loss|Target|max profit|max loss)\s*:?\s*([0-9]+(?:\.[0-9]+)?)", re.IGNORECASE)
+
+_RE_SPOT = re.compile(r"-\s*Spot:\s*([0-9]+(?:\.[0-9]+)?)")
+# Only lines that can feed _extract_ic_from_buffer are kept as tail context,
+# so verbose logging can't push the IC block out of the deque
+_IC_CONTEXT_KEYS = (
+    'Recommended Iron Condor', 'Spot:', 'Short Put:', 'Short Call:',
+    'Spread Width:', 'Expected Credit:', 'Max Profit:',
+)
+_IC_FIELD_RE = re.compile(
+    r"Short Put:\s*(?P<sp>[0-9]+(?:\.[0-9]+)?)"
+    r"|Short Call:\s*(?P<sc>[0-9]+(?:\.[0-9]+)?)"
+    r"|Spread Width:\s*(?P<w>[0-9]+)"
+    r"|Expected Credit:\s*(?P<cr>[0-9]+(?:\.[0-9]+)?)"
+    r"|Max Profit:\s*(?P<mp>[0-9]+(?:\.[0-9]+)?)\s*\|\s*Max Loss:\s*(?P<ml>[0-9]+(?:\.[0-9]+)?)"
+)
+
+
+def _fmt_named_amount(m: re.Match) -> str:
+    label = m.group(1)
+    amt = _fmt_currency(float(m.group(2)))
+    return f"{label}: {amt}"
 
 
 def _format_rupees_in_text(text: str) -> str:
     # @ 43.44 -> @ ₹43
-    text = re.sub(r"@\s*([0-9]+(?:\.[0-9]+)?)", lambda m: f"@ {_fmt_currency(float(m.group(1)))}", text)
+    text = _RE_AT_NUM.sub(lambda m: f"@ {_fmt_currency(float(m.group(1)))}", text)
     # Credit/P&L/Profit/Loss/Target numbers -> ₹ formatted
-    def _fmt_named_amount(m):
-        label = m.group(1)
-        amt = _fmt_currency(float(m.group(2)))
-        return f"{label}: {amt}"
-    text = re.sub(r"(?i)\b(Credit|P&L|Profit|Loss|Target|max profit|max loss)\s*:?\s*([0-9]+(?:\.[0-9]+)?)", _fmt_named_amount, text)
-    return text
+    return _RE_NAMED_AMOUNT.sub(_fmt_named_amount, text)
 
 
-def _fmt_immediate(cat: str, line: str) -> str:
-    ts = _ts_from_line(line)
+def _fmt_immediate(cat: str, line: str, ts: Optional[datetime] = None) -> str:
+    if ts is None:
+        ts = _ts_from_line(line)
     t12 = _fmt_time_12(ts)
     body = _format_rupees_in_text(line.strip())
     if cat == 'entry':
@@ -165,58 +259,40 @@ def _fmt_immediate(cat: str, line: str) -> str:
     return body
 
 
-def _extract_ic_from_buffer(lines: List[str]) -> Optional[Dict[str, float]]:
-    # Find the most recent "Recommended Iron Condor:" block and parse its details
+def _extract_ic_from_buffer(lines: Sequence[str]) -> Optional[Dict[str, float]]:
+    # Find the most recent "Recommended Iron Condor:" block and parse its details.
+    # Accepts the tail deque directly; only iterates, never copies.
+    n = len(lines)
     idx = -1
-    for i in range(len(lines) - 1, -1, -1):
-        if 'Recommended Iron Condor:' in lines[i]:
-            idx = i
+    for i, line in enumerate(reversed(lines)):
+        if 'Recommended Iron Condor:' in line:
+            idx = n - 1 - i
             break
     if idx == -1:
         return None
-    sp = sc = width = exp_credit = max_profit = max_loss = None
     spot = None
     # Look a few lines above for spot
-    for j in range(max(0, idx - 6), idx):
-        m = re.search(r"-\s*Spot:\s*([0-9]+(?:\.[0-9]+)?)", lines[j])
+    for line in islice(lines, max(0, idx - 6), idx):
+        m = _RE_SPOT.search(line)
         if m:
             try:
                 spot = float(m.group(1))
             except Exception:
                 pass
-    for k in range(idx + 1, min(idx + 12, len(lines))):
-        s = lines[k]
-        m = re.search(r"Short Put:\s*([0-9]+(?:\.[0-9]+)?)", s)
-        if m:
-            try:
-                sp = float(m.group(1))
-            except Exception:
-                pass
-        m = re.search(r"Short Call:\s*([0-9]+(?:\.[0-9]+)?)", s)
-        if m:
-            try:
-                sc = float(m.group(1))
-            except Exception:
-                pass
-        m = re.search(r"Spread Width:\s*([0-9]+)", s)
-        if m:
-            try:
-                width = float(m.group(1))
-            except Exception:
-                pass
-        m = re.search(r"Expected Credit:\s*([0-9]+(?:\.[0-9]+)?)", s)
-        if m:
-            try:
-                exp_credit = float(m.group(1))
-            except Exception:
-                pass
-        m = re.search(r"Max Profit:\s*([0-9]+(?:\.[0-9]+)?)\s*\|\s*Max Loss:\s*([0-9]+(?:\.[0-9]+)?)", s)
-        if m:
-            try:
-                max_profit = float(m.group(1))
-                max_loss = float(m.group(2))
-            except Exception:
-                pass
+    fields: Dict[str, float] = {}
+    for s in islice(lines, idx + 1, min(idx + 12, n)):
+        for m in _IC_FIELD_RE.finditer(s):
+            g = m.lastgroup
+            if g == 'ml':
+                # Max Profit/Max Loss match as a pair; lastgroup reports the closing group
+                fields['mp'] = float(m.group('mp'))
+            fields[g] = float(m.group(g))
+    sp = fields.get('sp')
+    sc = fields.get('sc')
+    width = fields.get('w')
+    exp_credit = fields.get('cr')
+    max_profit = fields.get('mp')
+    max_loss = fields.get('ml')
     if sp is None or sc is None or width is None:
         return None
     return {
@@ -230,6 +306,23 @@ def _extract_ic_from_buffer(lines: List[str]) -> Optional[Dict[str, float]]:
     }
 
 
+_ENTRY_CONSOLIDATED_TMPL = (
+    "📊 <b>IRON CONDOR ENTERED</b>\n"
+    "\n"
+    "🕐 {t12} | 📍 NIFTY: {spot:.2f}\n"
+    "\n"
+    "<b>Structure:</b>\n"
+    "🔴 SELL {sp} PE\n"
+    "🟢 BUY {pl} PE\n"
+    "🔴 SELL {sc} CE\n"
+    "🟢 BUY {cl} CE\n"
+    "\n"
+    "💰 <b>Credit:</b> {credit} ({credit_pts:.0f} pts)\n"
+    "📏 Width: {w} points\n"
+    "🎯 <b>Max Profit:</b> {max_p} | 🛑 <b>Max Loss:</b> {max_l}"
+)
+
+
 def _fmt_entry_consolidated(ts: datetime, ic: Dict[str, float]) -> str:
     t12 = _fmt_time_12(ts)
     sp = ic['sp']; sc = ic['sc']; w = ic['width']
@@ -239,20 +332,24 @@ def _fmt_entry_consolidated(ts: datetime, ic: Dict[str, float]) -> str:
     max_l = ic.get('max_loss', 0.0)
     credit_rupees = max_p if max_p else credit_pts * 75.0
     spot = ic.get('spot', 0.0)
-    lines = [
-        "📊 <b>IRON CONDOR ENTERED</b>",
-        "",
-        f"🕐 {t12} | 📍 NIFTY: {spot:.2f}",
-        "",
-        "<b>Structure:</b>",
-        f"🔴 SELL {int(sp)} PE", f"🟢 BUY {int(pl)} PE",
-        f"🔴 SELL {int(sc)} CE", f"🟢 BUY {int(cl)} CE",
-        "",
-        f"💰 <b>Credit:</b> {_fmt_currency(credit_rupees)} ({credit_pts:.0f} pts)",
-        f"📏 Width: {int(w)} points",
-        f"🎯 <b>Max Profit:</b> {_fmt_currency(max_p)} | 🛑 <b>Max Loss:</b> {_fmt_currency(max_l)}",
-    ]
-    return "\n".join(lines)
+    return _ENTRY_CONSOLIDATED_TMPL.format(
+        t12=t12, spot=spot,
+        sp=int(sp), pl=int(pl), sc=int(sc), cl=int(cl),
+        credit=_fmt_currency(credit_rupees), credit_pts=credit_pts, w=int(w),
+        max_p=_fmt_currency(max_p), max_l=_fmt_currency(max_l),
+    )
+
+
+_HOURLY_TMPL = (
+    "📋 <b>Hourly Summary</b>\n"
+    "🕐 {start} - {end}\n"
+    "\n"
+    "\n📊 <b>Market Activity</b>:\n"
+    "• {scans} market scans\n"
+    "• {monitoring} monitoring updates\n"
+    "\n💡 <b>Opportunities</b>:\n"
+    "• {rejections} rejected (risk filters)"
+)
 
 
 def _fmt_hourly(buf: HourlyBuffer) -> Optional[str]:
@@ -260,21 +357,26 @@ def _fmt_hourly(buf: HourlyBuffer) -> Optional[str]:
         return None
     start = buf.start or datetime.now()
     end = buf.end or datetime.now()
-    hdr = f"📋 <b>Hourly Summary</b>\n🕐 {_fmt_time_12(start)} - {_fmt_time_12(end)}\n"
-    parts = [hdr]
-    parts.append("\n📊 <b>Market Activity</b>:")
-    parts.append(f"• {len(buf.scans)} market scans")
-    parts.append(f"• {len(buf.monitoring)} monitoring updates")
-    parts.append("\n💡 <b>Opportunities</b>:")
-    parts.append(f"• {len(buf.rejections)} rejected (risk filters)")
+    msg = _HOURLY_TMPL.format(
+        start=_fmt_time_12(start), end=_fmt_time_12(end),
+        scans=len(buf.scans), monitoring=len(buf.monitoring), rejections=len(buf.rejections),
+    )
     if not (buf.scans or buf.rejections or buf.monitoring):
-        parts.append("\nAll quiet.")
-    return "\n".join(parts)
+        msg += "\n\nAll quiet."
+    return msg
+
+
+_stop_evt = threading.Event()
+
+
+def stop() -> None:
+    """Stop the hourly summary scheduler started by :func:`tail_file`."""
+    _stop_evt.set()
 
 
 def _summary_scheduler(send_func, token: str, chats: List[int], buf: HourlyBuffer, interval_minutes: int = 60):
     # Fire on the hour (or every interval) precisely
-    while True:
+    while not _stop_evt.is_set():
         now = datetime.now()
         if interval_minutes == 60:
             # next top of the hour
@@ -283,12 +385,19 @@ def _summary_scheduler(send_func, token: str, chats: List[int], buf: HourlyBuffe
             nxt = now + timedelta(minutes=interval_minutes)
             nxt = nxt.replace(second=0, microsecond=0)
         sleep_s = max(1, (nxt - now).total_seconds())
-        time.sleep(sleep_s)
+        # Monotonic deadline: immune to wall-clock jumps while waiting
+        deadline = time.monotonic() + sleep_s
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if _stop_evt.wait(remaining):
+                return
         try:
             msg = _fmt_hourly(buf)
             if msg:
-                for cid in chats:
-                    send_func(token, cid, msg, html=True)
+                # Fan out to all chats at once; bounded so a slow API can't stall the next tick
+                wait([_submit(cid, send_func, token, cid, msg, True) for cid in chats], timeout=15)
             buf.clear()
         except Exception:
             # ignore scheduler errors
@@ -296,58 +405,144 @@ def _summary_scheduler(send_func, token: str, chats: List[int], buf: HourlyBuffe
             continue
 
 
+def _make_watcher(path: Path):
+    """inotify watch on the log's directory, or None to fall back to polling."""
+    if INotify is None:
+        return None
+    try:
+        w = INotify()
+        w.add_watch(str(path.parent), inotify_flags.MODIFY | inotify_flags.MOVED_TO | inotify_flags.CREATE)
+        return w
+    except Exception:
+        return None
+
+
+def _follow(path: Path, poll_s: float, chunk_size: int = 65536) -> Iterator[str]:
+    """Yield complete lines appended to ``path``, forever.
+
+    Keeps one raw descriptor open and reads new bytes with ``os.read``; only
+    re-opens (from offset 0) when the file is rotated (inode change) or first
+    appears, and rewinds on truncation. Partial lines wait for their newline.
+    On Linux with ``inotify_simple`` installed, idle waits wake on file events
+    instead of sleeping the full ``poll_s``.
+    """
+    watcher = _make_watcher(path)
+
+    def idle() -> None:
+        if watcher is not None:
+            try:
+                watcher.read(timeout=int(poll_s * 1000))
+                return
+            except Exception:
+                pass
+        time.sleep(poll_s)
+
+    fd: Optional[int] = None
+    ino: Optional[int] = None
+    pending = b''
+    try:
+        while True:
+            try:
+                if fd is None:
+                    if not path.exists():
+                        idle()
+                        continue
+                    fd = os.open(str(path), os.O_RDONLY)
+                    ino = os.fstat(fd).st_ino
+                    pending = b''
+                chunk = os.read(fd, chunk_size)
+                if chunk:
+                    *lines, pending = (pending + chunk).split(b'\n')
+                    for raw in lines:
+                        yield raw.decode('utf-8', 'ignore')
+                    continue
+                # EOF: check for rotation/truncation, then wait
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    st = None
+                if st is None or st.st_ino != ino:
+                    os.close(fd)
+                    fd = None
+                    continue
+                if st.st_size < os.lseek(fd, 0, os.SEEK_CUR):
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    pending = b''
+                    continue
+                idle()
+            except Exception:
+                if fd is not None:
+                    try:
+                        os.close(fd)
+                    except Exception:
+                        pass
+                    fd = None
+                idle()
+    finally:
+        if fd is not None:
+            os.close(fd)
+        if watcher is not None:
+            watcher.close()
+
+
 def tail_file(path: Path, patterns: Iterable[str], poll_s: float = 1.5) -> None:
     token, chats = _load_token_and_chats()
     if not token or not chats:
         raise RuntimeError("Telegram alerts require bot token and allowed_chat_ids. Use telegram-setup and /id, then allow.")
 
     # Hourly buffer and scheduler
+    _stop_evt.clear()
     buf = HourlyBuffer()
     t = threading.Thread(target=_summary_scheduler, args=(_send_telegram_sync, token, chats, buf, 60), daemon=True)
     t.start()
 
-    pos = 0
     recent = deque(maxlen=200)
     last_entry_sig: Optional[str] = None
-    while True:
-        try:
-            if not path.exists():
-                time.sleep(poll_s)
+    # Hot-reload chats when telegram.json changes (e.g. after /allow); at most one stat per poll_s
+    chats_mtime = _telegram_file_mtime()
+    next_check = time.monotonic() + poll_s
+    try:
+        for line in _follow(path, poll_s):
+            if time.monotonic() >= next_check:
+                next_check = time.monotonic() + poll_s
+                mtime = _telegram_file_mtime()
+                if mtime != chats_mtime:
+                    chats_mtime = mtime
+                    new_token, new_chats = _load_token_and_chats()
+                    if new_token and new_chats:
+                        token = new_token
+                        chats[:] = new_chats  # in place: the summary thread shares this list
+            txt = line.strip()
+            if not txt:
                 continue
-            with path.open('r', encoding='utf-8', errors='ignore') as f:
-                f.seek(pos)
-                for line in f:
-                    txt = line.strip()
-                    if not txt:
-                        continue
+            try:
+                if any(k in txt for k in _IC_CONTEXT_KEYS):
                     recent.append(txt)
-                    scope, cat = _categorize(txt)
-                    if scope == 'immediate' and cat:
-                        if cat == 'entry':
-                            ic = _extract_ic_from_buffer(list(recent))
-                            if ic:
-                                ts = _ts_from_line(txt)
-                                sig = f"{int(ic['sp'])}-{int(ic['sc'])}-{int(ic['width'])}-{ts.strftime('%Y%m%d%H%M')}"
-                                # Deduplicate entries within the same minute
-                                if sig != last_entry_sig:
-                                    last_entry_sig = sig
-                                    msg = _fmt_entry_consolidated(ts, ic)
-                                    for cid in chats:
-                                        _send_telegram_sync(token, cid, msg, html=True)
-                            else:
-                                msg = _fmt_immediate(cat, txt)
-                                for cid in chats:
-                                    _send_telegram_sync(token, cid, msg, html=True)
+                scope, cat = _categorize(txt)
+                if not cat:
+                    # Not matched: ignore to avoid spam
+                    continue
+                # Parse the timestamp once per matched line and share it below
+                ts = _ts_from_line(txt)
+                if scope == 'immediate':
+                    if cat == 'entry':
+                        ic = _extract_ic_from_buffer(recent)
+                        if ic:
+                            sig = f"{int(ic['sp'])}-{int(ic['sc'])}-{int(ic['width'])}-{ts.strftime('%Y%m%d%H%M')}"
+                            # Deduplicate entries within the same minute
+                            if sig != last_entry_sig:
+                                last_entry_sig = sig
+                                msg = _fmt_entry_consolidated(ts, ic)
+                                _fanout(token, chats, msg)
                         else:
-                            msg = _fmt_immediate(cat, txt)
-                            for cid in chats:
-                                _send_telegram_sync(token, cid, msg, html=True)
-                    elif scope == 'hourly' and cat:
-                        buf.add(cat, txt, _ts_from_line(txt))
+                            msg = _fmt_immediate(cat, txt, ts)
+                            _fanout(token, chats, msg)
                     else:
-                        # Not matched: ignore to avoid spam
-                        pass
-                pos = f.tell()
-        except Exception:
-            time.sleep(poll_s)
-        time.sleep(poll_s)
+                        msg = _fmt_immediate(cat, txt, ts)
+                        _fanout(token, chats, msg)
+                elif scope == 'hourly':
+                    buf.add(cat, txt, ts)
+            except Exception:
+                continue
+    finally:
+        stop()
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .utils import jsonio
+
+
+# One keep-alive session for every outbound Bot API call in the process
+# (alerts fanout, token refresh notices, engine notifications).
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=8))
+
+# Bot API bodies are pre-encoded (orjson when available) and sent as data=;
+# per request rather than on SESSION so other uploads keep their content type
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+@lru_cache(maxsize=4)
+def send_url(token: str) -> str:
+    return f"https://api.telegram.org/bot{token}/sendMessage"
+
+
+def send_message(token: str, chat_id: int, text: str, html: bool = True, timeout: float = 10) -> bool:
+    """POST sendMessage; True on HTTP 200, False on any failure."""
+    try:
+        payload = {'chat_id': chat_id, 'text': text}
+        if html:
+            payload['parse_mode'] = 'HTML'
+        resp = SESSION.post(send_url(token), data=jsonio.dumps(payload), headers=JSON_HEADERS, timeout=timeout)
+        return resp.status_code == 200
+    except Exception:
+        return False
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -12,23 +13,43 @@ from telegram.constants import ParseMode
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
 
 from .query import QueryEngine
+from .utils import jsonio
 
 
 SECRETS_DIR = Path('.secrets')
 TELEGRAM_FILE = SECRETS_DIR / 'telegram.json'
 
 
+def _telegram_file_mtime() -> int:
+    try:
+        return TELEGRAM_FILE.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+@lru_cache(maxsize=1)
+def _read_telegram_file(mtime_ns: int) -> tuple[Optional[str], frozenset[int]]:
+    """Parse .secrets/telegram.json; keyed on mtime so edits invalidate the cache."""
+    if not mtime_ns:
+        return None, frozenset()
+    try:
+        data = jsonio.loads(TELEGRAM_FILE.read_bytes())
+    except Exception:
+        return None, frozenset()
+    ids: set[int] = set()
+    for x in data.get('allowed_chat_ids', []):
+        try:
+            ids.add(int(x))
+        except Exception:
+            pass
+    return data.get('bot_token'), frozenset(ids)
+
+
 def _load_token(env_var: str = 'TELEGRAM_BOT_TOKEN') -> Optional[str]:
     tok = os.getenv(env_var)
     if tok:
         return tok
-    if TELEGRAM_FILE.exists():
-        try:
-            data = json.loads(TELEGRAM_FILE.read_text(encoding='utf-8'))
-            return data.get('bot_token')
-        except Exception:
-            return None
-    return None
+    return _read_telegram_file(_telegram_file_mtime())[0]
 
 
 def _save_token(token: str) -> None:
@@ -36,25 +57,15 @@ def _save_token(token: str) -> None:
     data = {}
     if TELEGRAM_FILE.exists():
         try:
-            data = json.loads(TELEGRAM_FILE.read_text(encoding='utf-8'))
+            data = jsonio.loads(TELEGRAM_FILE.read_bytes())
         except Exception:
             data = {}
     data['bot_token'] = token
-    TELEGRAM_FILE.write_text(json.dumps(data, indent=2), encoding='utf-8')
+    TELEGRAM_FILE.write_bytes(jsonio.dumps_pretty(data))
 
 
 def _allowed_chat_ids() -> set[int]:
-    ids: set[int] = set()
-    if TELEGRAM_FILE.exists():
-        try:
-            data = json.loads(TELEGRAM_FILE.read_text(encoding='utf-8'))
-            for x in data.get('allowed_chat_ids', []):
-                try:
-                    ids.add(int(x))
-                except Exception:
-                    pass
-        except Exception:
-            pass
+    ids: set[int] = set(_read_telegram_file(_telegram_file_mtime())[1])
     env = os.getenv('TELEGRAM_ALLOWED_IDS')
     if env:
         for x in env.split(','):
@@ -80,13 +91,13 @@ def _store_allowed_chat_id(chat_id: int) -> None:
     data = {}
     if TELEGRAM_FILE.exists():
         try:
-            data = json.loads(TELEGRAM_FILE.read_text(encoding='utf-8'))
+            data = jsonio.loads(TELEGRAM_FILE.read_bytes())
         except Exception:
             data = {}
     ids = set(data.get('allowed_chat_ids', []))
     ids.add(int(chat_id))
     data['allowed_chat_ids'] = sorted(list(map(int, ids)))
-    TELEGRAM_FILE.write_text(json.dumps(data, indent=2), encoding='utf-8')
+    TELEGRAM_FILE.write_bytes(jsonio.dumps_pretty(data))
 
 
 async def _send_text(update: Update, text: str, ctx: ContextTypes.DEFAULT_TYPE) -> None:
@@ -99,6 +110,16 @@ def _qe() -> QueryEngine:
     return QueryEngine(log_dir="logs", config_path="config.yaml")
 
 
+def _answer(question: str) -> str:
+    qe = _qe()
+    return qe.execute_query(qe.parse_question(question)).text
+
+
+async def _answer_async(question: str) -> str:
+    # Log parsing / simulation are blocking; keep them off the PTB event loop
+    return await asyncio.to_thread(_answer, question)
+
+
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     msg = (
         "MCH Trading Bot — Telegram Interface\n"
@@ -118,10 +139,8 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if allowed and update.effective_chat and update.effective_chat.id not in allowed:
         await _send_text(update, "Unauthorized chat. Ask admin to /allow your chat id.", context)
         return
-    qe = _qe()
-    parsed = qe.parse_question("status")
-    resp = qe.execute_query(parsed)
-    await _send_text(update, resp.text, context)
+    text = await _answer_async("status")
+    await _send_text(update, text, context)
 
 
 async def trades(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -129,16 +148,14 @@ async def trades(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if allowed and update.effective_chat and update.effective_chat.id not in allowed:
         await _send_text(update, "Unauthorized chat. Ask admin to /allow your chat id.", context)
         return
-    qe = _qe()
     n = None
     if context.args:
         try:
             n = int(context.args[0])
         except Exception:
             n = None
-    parsed = qe.parse_question(f"trades last {n}" if n else "trades")
-    resp = qe.execute_query(parsed)
-    await _send_text(update, "```\n" + resp.text + "\n```", context)
+    text = await _answer_async(f"trades last {n}" if n else "trades")
+    await _send_text(update, "```\n" + text + "\n```", context)
 
 
 async def whatif(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -146,11 +163,9 @@ async def whatif(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if allowed and update.effective_chat and update.effective_chat.id not in allowed:
         await _send_text(update, "Unauthorized chat. Ask admin to /allow your chat id.", context)
         return
-    qe = _qe()
     args = " ".join(context.args) if context.args else ""
-    parsed = qe.parse_question(f"what if {args}")
-    resp = qe.execute_query(parsed)
-    await _send_text(update, resp.text, context)
+    text = await _answer_async(f"what if {args}")
+    await _send_text(update, text, context)
 
 
 async def any_text(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -158,11 +173,9 @@ async def any_text(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if allowed and update.effective_chat and update.effective_chat.id not in allowed:
         await _send_text(update, "Unauthorized chat. Ask admin to /allow your chat id.", context)
         return
-    qe = _qe()
     q = update.message.text if update.message else "status"
-    parsed = qe.parse_question(q)
-    resp = qe.execute_query(parsed)
-    await _send_text(update, resp.text, context)
+    text = await _answer_async(q)
+    await _send_text(update, text, context)
 
 
 def run(token: Optional[str] = None) -> None:
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
 import time
@@ -8,10 +7,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
-import requests
-
 from .auth.kite_auth import load_creds_from_env, login_and_get_request_token, exchange_request_token_for_access
 from .railway_client import update_env_variable, restart_railway_service
+from .telegram_http import send_message
+from .utils import jsonio
 
 
 log = logging.getLogger("token_refresh")
@@ -24,11 +23,7 @@ def _send_telegram(text: str) -> None:
     if not tok or not chat:
         return
     try:
-        requests.post(
-            f"https://api.telegram.org/bot{tok}/sendMessage",
-            json={"chat_id": int(chat), "text": text, "parse_mode": "HTML"},
-            timeout=10,
-        )
+        send_message(tok, int(chat), text)
     except Exception:
         pass
 
@@ -36,7 +31,10 @@ def _send_telegram(text: str) -> None:
 def _save_state(d: dict) -> None:
     try:
         STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        STATE_FILE.write_text(json.dumps(d, indent=2), encoding="utf-8")
+        # Write-then-rename so a crash never leaves a half-written state file
+        tmp = STATE_FILE.with_suffix('.tmp')
+        tmp.write_bytes(jsonio.dumps_pretty(d))
+        os.replace(tmp, STATE_FILE)
     except Exception:
         pass
 
@@ -44,7 +42,7 @@ def _save_state(d: dict) -> None:
 def _load_state() -> dict:
     try:
         if STATE_FILE.exists():
-            return json.loads(STATE_FILE.read_text(encoding="utf-8"))
+            return jsonio.loads(STATE_FILE.read_bytes())
     except Exception:
         pass
     return {}
@@ -62,7 +60,7 @@ def refresh_token_once() -> Optional[str]:
         secrets_dir.mkdir(exist_ok=True)
         path = secrets_dir / 'kite.json'
         data = {"api_key": creds.api_key, "api_secret": creds.api_secret, "access_token": access_token}
-        path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+        path.write_bytes(jsonio.dumps_pretty(data))
     except Exception as e:
         log.warning(f"Failed to persist local token: {e}")
     return access_token
@@ -4,9 +4,8 @@ import logging
 import os
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from time import sleep
 
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.blocking import BlockingScheduler
 
 from .token_refresh import run_refresh_workflow
 
@@ -16,15 +15,13 @@ log = logging.getLogger("token_scheduler")
 
 def schedule_daily(hour: int = 6, minute: int = 0, tz: str = "Asia/Kolkata") -> None:
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s - %(message)s")
-    scheduler = BackgroundScheduler(timezone=tz)
+    scheduler = BlockingScheduler(timezone=tz)
     scheduler.add_job(run_refresh_workflow, trigger='cron', hour=hour, minute=minute, id='token_refresh')
-    scheduler.start()
     log.info(f"Token scheduler started for {hour:02d}:{minute:02d} {tz}")
     try:
-        while True:
-            sleep(3600)
+        scheduler.start()  # blocks this thread until shutdown
     except (KeyboardInterrupt, SystemExit):
-        scheduler.shutdown()
+        pass
 
 
 if __name__ == "__main__":
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import orjson  # optional; C parser, works on bytes without a utf-8 decode step
+
+    def loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    import json
+
+    def loads(data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
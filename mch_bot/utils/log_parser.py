@@ -1,13 +1,27 @@
 from __future__ import annotations
 
+import heapq
+import mmap
+import os
 import re
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 
-@dataclass
+_RE_TS = re.compile(r"(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2}:\d{2})")
+_RE_DECISION_B = re.compile(rb"Live Market Data:|Recommended Iron Condor:|IC validation failed")
+_RE_FIELDS = re.compile(
+    r"Short Put:\s*(?P<sp>[0-9]+(?:\.[0-9]+)?)"
+    r"|Short Call:\s*(?P<sc>[0-9]+(?:\.[0-9]+)?)"
+    r"|Spread Width:\s*(?P<w>[0-9]+)"
+    r"|Expected Credit:\s*(?P<cr>[0-9]+(?:\.[0-9]+)?)"
+    r"|Max Profit:\s*(?P<mp>[0-9]+(?:\.[0-9]+)?)\s*\|\s*Max Loss:\s*(?P<ml>[0-9]+(?:\.[0-9]+)?)"
+)
+
+
+@dataclass(slots=True, frozen=True)
 class TradeRecord:
     timestamp: datetime
     short_put: Optional[float]
@@ -19,7 +33,7 @@ class TradeRecord:
     context: Dict[str, str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Decision:
     timestamp: datetime
     message: str
@@ -29,29 +43,56 @@ class Decision:
 class LogParser:
     def __init__(self, log_dir: Path) -> None:
         self.log_dir = log_dir
+        # Consecutive lines usually share a second; reuse the last parsed timestamp
+        self._last_prefix: Optional[str] = None
+        self._last_dt: Optional[datetime] = None
 
     def _iter_log_files(self) -> List[Path]:
         if not self.log_dir.exists():
             return []
-        files = sorted([p for p in self.log_dir.glob("**/*") if p.is_file()], key=lambda p: p.stat().st_mtime, reverse=True)
+        # One scandir walk; each file is stat'ed once and reused as the sort key
+        entries: List[Tuple[str, float]] = []
+        stack = [str(self.log_dir)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for e in it:
+                        try:
+                            if e.is_dir(follow_symlinks=False):
+                                stack.append(e.path)
+                            elif e.is_file():
+                                entries.append((e.path, e.stat().st_mtime))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
         # Only read up to a handful of latest files to keep it light
-        return files[:5]
+        return [Path(p) for p, _ in heapq.nlargest(5, entries, key=lambda e: e[1])]
 
     def _parse_dt_from_line(self, line: str) -> Optional[datetime]:
         # Expect lines starting with 'YYYY-MM-DD HH:MM:SS,' optionally timezone info is ignored
-        m = re.match(r"(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2}:\d{2})", line)
+        if not line[:1].isdigit():
+            return None  # cheap reject before touching the regex engine
+        if self._last_prefix is not None and line.startswith(self._last_prefix):
+            return self._last_dt
+        m = _RE_TS.match(line)
         if not m:
             return None
+        d, t = m.group(1, 2)
         try:
-            return datetime.fromisoformat(f"{m.group(1)} {m.group(2)}")
+            dt = datetime(int(d[:4]), int(d[5:7]), int(d[8:10]), int(t[:2]), int(t[3:5]), int(t[6:8]))
         except Exception:
             return None
+        self._last_prefix = line[:m.end()]
+        self._last_dt = dt
+        return dt
 
     def parse_structured_logs(self) -> List[TradeRecord]:
-        trades: List[TradeRecord] = []
+        # Plain tuples in the loop; TradeRecords are built once at the end
+        raw_trades: List[Tuple] = []
         for f in self._iter_log_files():
             try:
-                lines = f.read_text(encoding="utf-8", errors="ignore").splitlines()
+                fh = open(f, "r", encoding="utf-8", errors="ignore")
             except Exception:
                 continue
 
@@ -64,86 +105,61 @@ class LogParser:
             cur_mp: Optional[float] = None
             cur_ml: Optional[float] = None
 
-            def commit():
-                nonlocal cur_ts, cur_sp, cur_sc, cur_width, cur_credit, cur_mp, cur_ml
-                if cur_ts and (cur_sp or cur_sc):
-                    trades.append(
-                        TradeRecord(
-                            timestamp=cur_ts,
-                            short_put=cur_sp,
-                            short_call=cur_sc,
-                            width=cur_width,
-                            credit=cur_credit,
-                            max_profit=cur_mp,
-                            max_loss=cur_ml,
-                            context={},
-                        )
-                    )
-                cur_ts = None
-                cur_sp = None
-                cur_sc = None
-                cur_width = None
-                cur_credit = None
-                cur_mp = None
-                cur_ml = None
-
-            for raw in lines:
-                # Detect block start via timestamp
-                ts = self._parse_dt_from_line(raw)
-                if ts:
-                    cur_ts = ts
-
-                # One-line captures
-                m = re.search(r"Short Put:\s*([0-9]+(?:\.[0-9]+)?)", raw)
-                if m:
-                    try:
-                        cur_sp = float(m.group(1))
-                    except Exception:
-                        pass
-                m = re.search(r"Short Call:\s*([0-9]+(?:\.[0-9]+)?)", raw)
-                if m:
-                    try:
-                        cur_sc = float(m.group(1))
-                    except Exception:
-                        pass
-                m = re.search(r"Spread Width:\s*([0-9]+)", raw)
-                if m:
-                    try:
-                        cur_width = float(m.group(1))
-                    except Exception:
-                        pass
-                m = re.search(r"Expected Credit:\s*([0-9]+(?:\.[0-9]+)?)", raw)
-                if m:
-                    try:
-                        cur_credit = float(m.group(1))
-                    except Exception:
-                        pass
-                m = re.search(r"Max Profit:\s*([0-9]+(?:\.[0-9]+)?)\s*\|\s*Max Loss:\s*([0-9]+(?:\.[0-9]+)?)", raw)
-                if m:
-                    try:
-                        cur_mp = float(m.group(1))
-                        cur_ml = float(m.group(2))
-                    except Exception:
-                        pass
-                # When a simulated order line appears, we can commit the current block
-                if "Simulated order placement" in raw:
-                    commit()
+            with fh:
+                for raw in fh:
+                    # Detect block start via timestamp
+                    ts = self._parse_dt_from_line(raw)
+                    if ts:
+                        cur_ts = ts
+
+                    # One-line captures: a single scan dispatching on the matched group
+                    for m in _RE_FIELDS.finditer(raw):
+                        g = m.lastgroup
+                        if g == "sp":
+                            cur_sp = float(m.group("sp"))
+                        elif g == "sc":
+                            cur_sc = float(m.group("sc"))
+                        elif g == "w":
+                            cur_width = float(m.group("w"))
+                        elif g == "cr":
+                            cur_credit = float(m.group("cr"))
+                        elif g == "ml":
+                            # Max Profit/Max Loss match as a pair; lastgroup reports the closing group
+                            cur_mp = float(m.group("mp"))
+                            cur_ml = float(m.group("ml"))
+                    # When a simulated order line appears, we can commit the current block
+                    if "Simulated order placement" in raw:
+                        if cur_ts and (cur_sp or cur_sc):
+                            raw_trades.append((cur_ts, cur_sp, cur_sc, cur_width, cur_credit, cur_mp, cur_ml))
+                        cur_ts = cur_sp = cur_sc = cur_width = cur_credit = cur_mp = cur_ml = None
 
             # Ensure last block committed
-            commit()
+            if cur_ts and (cur_sp or cur_sc):
+                raw_trades.append((cur_ts, cur_sp, cur_sc, cur_width, cur_credit, cur_mp, cur_ml))
 
         # Sort newest first
-        trades.sort(key=lambda t: t.timestamp, reverse=True)
-        return trades
+        raw_trades.sort(key=lambda t: t[0], reverse=True)
+        return [TradeRecord(*t, context={}) for t in raw_trades]
 
     def extract_trade_decisions(self) -> List[Decision]:
         decisions: List[Decision] = []
         for f in self._iter_log_files():
             try:
-                for raw in f.read_text(encoding="utf-8", errors="ignore").splitlines():
-                    if "Live Market Data:" in raw or "Recommended Iron Condor:" in raw or "IC validation failed" in raw:
-                        ts = self._parse_dt_from_line(raw) or datetime.now()
-                        decisions.append(Decision(timestamp=ts, message=raw.strip(), context={}))
+                with open(f, "rb") as fh:
+                    if os.fstat(fh.fileno()).st_size == 0:
+                        continue
+                    with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        # Search the mapped bytes for decision markers and decode only those lines
+                        last_start = -1
+                        for m in _RE_DECISION_B.finditer(mm):
+                            start = mm.rfind(b"\n", 0, m.start()) + 1
+                            if start == last_start:
+                                continue  # several markers on one line
+                            last_start = start
+                            end = mm.find(b"\n", m.end())
+                            raw = mm[start:end if end != -1 else len(mm)].decode("utf-8", "ignore")
+                            ts = self._parse_dt_from_line(raw) or datetime.now()
+                            decisions.append(Decision(timestamp=ts, message=raw.strip(), context={}))
             except Exception:
                 continue
         return decisions
@@ -7,12 +7,13 @@ from dataclasses import dataclass
 @dataclass
 class RateLimiter:
     min_interval_s: float
-    _last: float = 0.0
+    # monotonic() has an arbitrary origin, so start at -inf rather than 0.0
+    _last: float = float("-inf")
 
     def wait(self) -> None:
-        now = time.time()
+        now = time.monotonic()
         dt = now - self._last
         if dt < self.min_interval_s:
             time.sleep(self.min_interval_s - dt)
-        self._last = time.time()
-
+            now = time.monotonic()
+        self._last = now
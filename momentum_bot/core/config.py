@@ -4,6 +4,7 @@ Loads from YAML and overrides with environment variables
 """
 
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, Optional
 import yaml
@@ -90,204 +91,222 @@ class Config:
                 f"Got: {self.entry_dte_min}-{self.entry_dte_max}"
             )
 
+        # Parse clock times once so tick-path checks compare time objects directly
+        for name in ('market_open_time', 'market_close_time'):
+            try:
+                getattr(self, name)
+            except ValueError:
+                raise ValueError(f"Invalid HH:MM value for {name[:-5]}") from None
+
+    # Config values are fixed once validated, so each property is resolved once
+    # per instance (cached_property needs __dict__, so no __slots__ here)
+
     # Capital & Risk properties
-    @property
+    @cached_property
     def capital(self) -> int:
         return self._config['capital']
 
-    @property
+    @cached_property
     def max_capital_per_trade_base(self) -> float:
         return self._config['max_capital_per_trade_base']
 
-    @property
+    @cached_property
     def max_capital_per_trade_max(self) -> float:
         return self._config['max_capital_per_trade_max']
 
-    @property
+    @cached_property
     def max_loss_per_trade(self) -> int:
         return self._config['max_loss_per_trade']
 
-    @property
+    @cached_property
     def max_daily_loss(self) -> int:
         return self._config['max_daily_loss']
 
-    @property
+    @cached_property
     def max_weekly_loss(self) -> int:
         return self._config['max_weekly_loss']
 
-    @property
+    @cached_property
     def max_positions(self) -> int:
         return self._config['max_positions']
 
     # Entry parameters
-    @property
+    @cached_property
     def entry_dte_min(self) -> int:
         return self._config['entry']['dte_min']
 
-    @property
+    @cached_property
     def entry_dte_max(self) -> int:
         return self._config['entry']['dte_max']
 
-    @property
+    @cached_property
     def entry_strike_distance_min(self) -> int:
         return self._config['entry']['strike_distance_min']
 
-    @property
+    @cached_property
     def entry_strike_distance_max(self) -> int:
         return self._config['entry']['strike_distance_max']
 
-    @property
+    @cached_property
     def entry_adx_threshold(self) -> float:
         return self._config['entry']['adx_threshold']
 
-    @property
+    @cached_property
     def entry_ema_period(self) -> int:
         return self._config['entry']['ema_period']
 
-    @property
+    @cached_property
     def entry_rsi_max(self) -> float:
         return self._config['entry']['rsi_max']
 
-    @property
+    @cached_property
     def entry_iv_percentile_max(self) -> float:
         return self._config['entry']['iv_percentile_max']
 
-    @property
+    @cached_property
     def entry_window_start(self) -> str:
         return self._config['entry']['entry_window_start']
 
-    @property
+    @cached_property
     def entry_window_end(self) -> str:
         return self._config['entry']['entry_window_end']
 
     # Exit parameters
-    @property
+    @cached_property
     def exit_profit_target_pct(self) -> float:
         return self._config['exit']['profit_target_pct']
 
-    @property
+    @cached_property
     def exit_partial_exit_pct(self) -> float:
         return self._config['exit']['partial_exit_pct']
 
-    @property
+    @cached_property
     def exit_stop_loss_pct(self) -> float:
         return self._config['exit']['stop_loss_pct']
 
-    @property
+    @cached_property
     def exit_time_exit_dte(self) -> int:
         return self._config['exit']['time_exit_dte']
 
-    @property
+    @cached_property
     def exit_wednesday_exit(self) -> bool:
         return self._config['exit']['wednesday_exit']
 
-    @property
+    @cached_property
     def exit_iv_crush_threshold(self) -> float:
         return self._config['exit']['iv_crush_threshold']
 
-    @property
+    @cached_property
     def exit_trailing_method(self) -> str:
         return self._config['exit']['trailing_method']
 
     # Risk adjustments
-    @property
+    @cached_property
     def risk_weekend_max_capital(self) -> float:
         return self._config['risk']['weekend_max_capital']
 
-    @property
+    @cached_property
     def risk_event_max_capital(self) -> float:
         return self._config['risk']['event_max_capital']
 
     # Regime classification
-    @property
+    @cached_property
     def regime_adx_trending(self) -> float:
         return self._config['regime']['adx_trending']
 
-    @property
+    @cached_property
     def regime_adx_ranging(self) -> float:
         return self._config['regime']['adx_ranging']
 
-    @property
+    @cached_property
     def regime_vix_volatile(self) -> float:
         return self._config['regime']['vix_volatile']
 
-    @property
+    @cached_property
     def regime_atr_percentile_high(self) -> float:
         return self._config['regime']['atr_percentile_high']
 
     # Execution
-    @property
+    @cached_property
     def execution_broker(self) -> str:
         return self._config['execution']['broker']
 
-    @property
+    @cached_property
     def execution_dry_run(self) -> bool:
         return self._config['execution']['dry_run']
 
-    @property
+    @cached_property
     def execution_slippage_rate(self) -> float:
         return self._config['execution']['slippage_rate']
 
-    @property
+    @cached_property
     def execution_brokerage_per_order(self) -> float:
         return self._config['execution']['brokerage_per_order']
 
-    @property
+    @cached_property
     def execution_tax_rate(self) -> float:
         return self._config['execution']['tax_rate']
 
     # Telegram
-    @property
+    @cached_property
     def telegram_bot_token(self) -> str:
         return self._config['telegram']['bot_token']
 
-    @property
+    @cached_property
     def telegram_chat_id(self) -> str:
         return self._config['telegram']['chat_id']
 
-    @property
+    @cached_property
     def telegram_override_mode(self) -> str:
         return self._config['telegram']['override_mode']
 
     # Kite API
-    @property
+    @cached_property
     def kite_api_key(self) -> str:
         return self._config['kite']['api_key']
 
-    @property
+    @cached_property
     def kite_api_secret(self) -> str:
         return self._config['kite']['api_secret']
 
-    @property
+    @cached_property
     def kite_access_token(self) -> str:
         return self._config['kite']['access_token']
 
     # Instrument
-    @property
+    @cached_property
     def instrument_symbol(self) -> str:
         return self._config['instrument']['symbol']
 
-    @property
+    @cached_property
     def instrument_lot_size(self) -> int:
         return self._config['instrument']['lot_size']
 
-    @property
+    @cached_property
     def instrument_underlying_symbol(self) -> str:
         return self._config['instrument']['underlying_symbol_zerodha']
 
     # Market hours
-    @property
+    @cached_property
     def market_open(self) -> str:
         return self._config['market']['open']
 
-    @property
+    @cached_property
     def market_close(self) -> str:
         return self._config['market']['close']
 
-    @property
+    @cached_property
     def market_timezone(self) -> str:
         return self._config['market']['timezone']
 
+    @cached_property
+    def market_open_time(self) -> time:
+        return time.fromisoformat(self.market_open)
+
+    @cached_property
+    def market_close_time(self) -> time:
+        return time.fromisoformat(self.market_close)
+
     # Utility methods
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key"""
@@ -4,9 +4,278 @@ Technical Indicators for MCH Bot 3.0
 Implements: ADX, RSI, MACD, EMA, VWAP, ATR, Bollinger Bands
 """
 
+import math
+from bisect import bisect_left, insort
+from collections import OrderedDict, deque
+
 import numpy as np
 import pandas as pd
-from typing import Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+try:
+    from numba import njit  # optional; enables the compiled ADX kernel
+except ImportError:
+    njit = None
+
+
+_RESULT_CACHE: "OrderedDict[tuple, Tuple[Tuple[pd.Series, ...], pd.Series]]" = OrderedDict()
+_RESULT_CACHE_SIZE = 128
+
+
+def _memoized(kind: str, inputs: Tuple[pd.Series, ...], period: int, compute: Callable[[], pd.Series]) -> pd.Series:
+    """
+    Return a cached indicator result for the same input Series objects.
+
+    Series are unhashable, so the key is built from their ids plus the length,
+    last index and last value (a tick appended or the live bar updated in place
+    forces a recompute). The inputs are kept alongside the result and compared
+    by identity on a hit, so a recycled id can never return a stale result.
+    Cached results are shared; callers must treat them as read-only.
+    """
+    first = inputs[0]
+    if not len(first):
+        return compute()
+    key = (kind, period, len(first), first.index[-1]) + tuple((id(s), s.iat[-1]) for s in inputs)
+    hit = _RESULT_CACHE.get(key)
+    if hit is not None and all(a is b for a, b in zip(hit[0], inputs)):
+        _RESULT_CACHE.move_to_end(key)
+        return hit[1]
+
+    result = compute()
+    _RESULT_CACHE[key] = (inputs, result)
+    if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+        _RESULT_CACHE.popitem(last=False)
+    return result
+
+
+def _cumsum_skipna(x: np.ndarray) -> np.ndarray:
+    """Running sum with Series.cumsum() NaN semantics (NaN in place, skipped in the total)."""
+    mask = np.isnan(x)
+    if not mask.any():
+        return np.add.accumulate(x)
+    out = np.nancumsum(x)
+    out[mask] = np.nan
+    return out
+
+
+def _percentile_rank(values: np.ndarray, lookback: int) -> float:
+    """Share (0-100) of the last ``lookback`` values strictly below the latest one."""
+    window = values[-lookback:]
+    return float(np.count_nonzero(window < window[-1])) / len(window) * 100
+
+
+def _true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> np.ndarray:
+    h = high.to_numpy(dtype=float)
+    l = low.to_numpy(dtype=float)
+    prev_close = np.roll(close.to_numpy(dtype=float), 1)
+    if len(prev_close):
+        prev_close[0] = np.nan
+
+    # fmax skips NaN like DataFrame.max(axis=1), so bar 0 falls back to high - low
+    return np.fmax(h - l, np.fmax(np.abs(h - prev_close), np.abs(l - prev_close)))
+
+
+def _wilder_kernel(x: np.ndarray, alpha: float) -> np.ndarray:
+    # Same contract as Series.ewm(alpha=alpha, adjust=False).mean(): seeded by the
+    # first observation, NaN inputs carry the average forward and decay its weight
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    avg = np.nan
+    old_wt = 1.0
+    for i in range(n):
+        v = x[i]
+        if np.isnan(avg):
+            if not np.isnan(v):
+                avg = v
+        else:
+            old_wt *= 1.0 - alpha
+            if not np.isnan(v):
+                if avg != v:
+                    avg = (old_wt * avg + alpha * v) / (old_wt + alpha)
+                old_wt = 1.0
+        out[i] = avg
+    return out
+
+
+def _adx_kernel(h: np.ndarray, l: np.ndarray, c: np.ndarray, period: int):
+    n = h.shape[0]
+    tr = np.empty(n)
+    plus_dm = np.zeros(n)
+    minus_dm = np.zeros(n)
+    for i in range(n):
+        hl = h[i] - l[i]
+        if i == 0:
+            tr[i] = hl
+            continue
+        hc = abs(h[i] - c[i - 1])
+        lc = abs(l[i] - c[i - 1])
+        tr[i] = max(hl, hc, lc)
+        up = h[i] - h[i - 1]
+        down = l[i - 1] - l[i]
+        if up > down and up > 0:
+            plus_dm[i] = up
+        if down > up and down > 0:
+            minus_dm[i] = down
+    alpha = 1.0 / period
+    atr = _wilder_kernel(tr, alpha)
+    plus_di = 100 * (_wilder_kernel(plus_dm, alpha) / atr)
+    minus_di = 100 * (_wilder_kernel(minus_dm, alpha) / atr)
+    dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+    adx = _wilder_kernel(dx, alpha)
+    return adx, plus_di, minus_di
+
+
+def _div(a: float, b: float) -> float:
+    # NumPy float semantics (x/0 -> +-inf, 0/0 -> NaN) in scalar code
+    if b == 0.0:
+        if a == 0.0 or a != a:
+            return np.nan
+        return np.inf if a > 0 else -np.inf
+    return a / b
+
+
+def _ewm_step(avg: float, old_wt: float, v: float, alpha: float):
+    # One step of the _wilder_kernel recurrence, for scalar state
+    if np.isnan(avg):
+        if not np.isnan(v):
+            avg = v
+    else:
+        old_wt *= 1.0 - alpha
+        if not np.isnan(v):
+            if avg != v:
+                avg = (old_wt * avg + alpha * v) / (old_wt + alpha)
+            old_wt = 1.0
+    return avg, old_wt
+
+
+def _fused_kernel(h: np.ndarray, l: np.ndarray, c: np.ndarray, period: int,
+                  ema_period: int, fast: int, slow: int, signal: int):
+    # Single pass over the bars for every indicator _calculate_all_indicators needs;
+    # inputs must be NaN-free. Returns the last values plus the full SMA ATR series
+    # (needed for the ATR percentile).
+    n = c.shape[0]
+    a_w = 1.0 / period
+    a_e = 2.0 / (ema_period + 1)
+    a_f = 2.0 / (fast + 1)
+    a_s = 2.0 / (slow + 1)
+    a_g = 2.0 / (signal + 1)
+
+    tr_hist = np.empty(n)
+    atr = np.full(n, np.nan)
+    tr_sum = 0.0
+    tr_s = pdm_s = mdm_s = dx_s = ema = ema_f = ema_s = sig = np.nan
+    tr_w = pdm_w = mdm_w = dx_w = ema_w = f_w = s_w = g_w = 1.0
+    plus_di = minus_di = macd = np.nan
+
+    for i in range(n):
+        if i == 0:
+            tr = h[0] - l[0]
+            pdm = 0.0
+            mdm = 0.0
+        else:
+            tr = max(h[i] - l[i], abs(h[i] - c[i - 1]), abs(l[i] - c[i - 1]))
+            up = h[i] - h[i - 1]
+            down = l[i - 1] - l[i]
+            pdm = up if (up > down and up > 0) else 0.0
+            mdm = down if (down > up and down > 0) else 0.0
+
+        # SMA ATR
+        tr_hist[i] = tr
+        tr_sum += tr
+        if i >= period:
+            tr_sum -= tr_hist[i - period]
+        if i >= period - 1:
+            atr[i] = tr_sum / period
+
+        # Wilder ADX / DI
+        tr_s, tr_w = _ewm_step(tr_s, tr_w, tr, a_w)
+        pdm_s, pdm_w = _ewm_step(pdm_s, pdm_w, pdm, a_w)
+        mdm_s, mdm_w = _ewm_step(mdm_s, mdm_w, mdm, a_w)
+        plus_di = 100 * _div(pdm_s, tr_s)
+        minus_di = 100 * _div(mdm_s, tr_s)
+        dx = 100 * _div(abs(plus_di - minus_di), plus_di + minus_di)
+        dx_s, dx_w = _ewm_step(dx_s, dx_w, dx, a_w)
+
+        # EMA and MACD
+        ema, ema_w = _ewm_step(ema, ema_w, c[i], a_e)
+        ema_f, f_w = _ewm_step(ema_f, f_w, c[i], a_f)
+        ema_s, s_w = _ewm_step(ema_s, s_w, c[i], a_s)
+        macd = ema_f - ema_s
+        sig, g_w = _ewm_step(sig, g_w, macd, a_g)
+
+    # SMA RSI over the last `period` price changes (the first bar's change counts as 0)
+    rsi = np.nan
+    if n >= period:
+        gain = 0.0
+        loss = 0.0
+        for i in range(max(n - period, 1), n):
+            d = c[i] - c[i - 1]
+            if d > 0:
+                gain += d
+            else:
+                loss -= d
+        rsi = 100 - _div(100.0, 1 + _div(gain / period, loss / period))
+
+    last = np.array([dx_s, plus_di, minus_di, rsi, macd, sig, macd - sig, ema])
+    return last, atr
+
+
+if njit is not None:
+    # No fastmath: the kernels rely on NaN checks to mirror pandas' ewm semantics
+    _wilder_kernel = njit(cache=True)(_wilder_kernel)
+    _adx_kernel = njit(cache=True)(_adx_kernel)
+    _div = njit(cache=True)(_div)
+    _ewm_step = njit(cache=True)(_ewm_step)
+    _fused_kernel = njit(cache=True)(_fused_kernel)
+
+    # Compile (or load from the on-disk cache) at import, not on the first live tick
+    _warm = np.array([2.0, 3.0, 2.5])
+    _adx_kernel(_warm + 1.0, _warm - 1.0, _warm, 14)
+    _fused_kernel(_warm + 1.0, _warm - 1.0, _warm, 14, 20, 12, 26, 9)
+    del _warm
+
+
+class RollingPercentile:
+    """
+    Percentile rank over a sliding window, for callers that feed one value per bar
+
+    Keeps the window sorted so each query is a binary search instead of a full
+    pass over ``lookback`` values. NaN inputs are ignored.
+    """
+
+    def __init__(self, lookback: int = 252):
+        self.lookback = lookback
+        self._fifo: Deque[float] = deque()
+        self._sorted: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._fifo)
+
+    def update(self, value: float) -> float:
+        """
+        Add the newest value and return its percentile rank in the window
+
+        Args:
+            value: Latest indicator value (e.g. ATR, IV)
+
+        Returns:
+            Percentile (0-100); 50.0 until at least two values are held
+        """
+        value = float(value)
+        if not math.isnan(value):
+            self._fifo.append(value)
+            insort(self._sorted, value)
+            if len(self._fifo) > self.lookback:
+                old = self._fifo.popleft()
+                del self._sorted[bisect_left(self._sorted, old)]
+        return self.rank(value)
+
+    def rank(self, value: float) -> float:
+        """Percentile rank of ``value`` against the current window"""
+        n = len(self._sorted)
+        if n < 2 or math.isnan(value):
+            return 50.0
+        return bisect_left(self._sorted, value) / n * 100
 
 
 class TechnicalIndicators:
@@ -27,7 +296,23 @@ class TechnicalIndicators:
         Returns:
             Series of EMA values
         """
-        return prices.ewm(span=period, adjust=False).mean()
+        return _memoized("ema", (prices,), period, lambda: prices.ewm(span=period, adjust=False).mean())
+
+    @staticmethod
+    def update_ema(prev: float, new: float, period: int) -> float:
+        """
+        Advance an EMA by one bar (same smoothing as calculate_ema)
+
+        Args:
+            prev: Previous EMA value
+            new: New price
+            period: EMA period
+
+        Returns:
+            Updated EMA value
+        """
+        alpha = 2 / (period + 1)
+        return alpha * new + (1 - alpha) * prev
 
     @staticmethod
     def calculate_sma(prices: pd.Series, period: int) -> pd.Series:
@@ -55,15 +340,60 @@ class TechnicalIndicators:
         Returns:
             Series of RSI values (0-100)
         """
-        delta = prices.diff()
+        return _memoized("rsi", (prices,), period, lambda: TechnicalIndicators._rsi(prices, period))
+
+    @staticmethod
+    def update_rsi(avg_gain: float, avg_loss: float, prev_price: float, new_price: float,
+                   period: int = 14) -> Tuple[float, float, float]:
+        """
+        Advance RSI by one bar using Wilder's running averages
+
+        Seed avg_gain/avg_loss from the last bars of history; unlike
+        calculate_rsi's rolling window this needs no history on each tick.
+
+        Args:
+            avg_gain: Previous average gain
+            avg_loss: Previous average loss
+            prev_price: Previous close
+            new_price: New close
+            period: RSI period (default 14)
+
+        Returns:
+            Tuple of (rsi, avg_gain, avg_loss)
+        """
+        delta = new_price - prev_price
+        avg_gain = (avg_gain * (period - 1) + max(delta, 0.0)) / period
+        avg_loss = (avg_loss * (period - 1) + max(-delta, 0.0)) / period
 
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        if avg_loss == 0:
+            rsi = 100.0 if avg_gain > 0 else math.nan
+        else:
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
 
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
+        return rsi, avg_gain, avg_loss
 
-        return rsi
+    @staticmethod
+    def _rsi(prices: pd.Series, period: int) -> pd.Series:
+        x = prices.to_numpy(dtype=float)
+        n = len(x)
+        rsi = np.full(n, np.nan)
+        if n >= period:
+            delta = np.diff(x, prepend=x[:1])
+            # fmax maps NaN deltas to 0, as delta.where(delta > 0, 0) did
+            gain = np.fmax(delta, 0.0)
+            loss = np.fmax(-delta, 0.0)
+
+            # Windowed means from prefix sums; the terms are non-negative, so a
+            # window of zeros stays exactly zero
+            cg = np.concatenate(([0.0], np.cumsum(gain)))
+            cl = np.concatenate(([0.0], np.cumsum(loss)))
+            avg_gain = (cg[period:] - cg[:-period]) / period
+            avg_loss = (cl[period:] - cl[:-period]) / period
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rsi[period - 1:] = 100 - (100 / (1 + avg_gain / avg_loss))
+
+        return pd.Series(rsi, index=prices.index)
 
     @staticmethod
     def calculate_atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
@@ -79,11 +409,29 @@ class TechnicalIndicators:
         Returns:
             Series of ATR values
         """
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
+        return _memoized("atr", (high, low, close), period, lambda: TechnicalIndicators._atr(high, low, close, period))
 
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    @staticmethod
+    def update_atr(prev_atr: float, high: float, low: float, prev_close: float, period: int = 14) -> float:
+        """
+        Advance ATR by one bar using Wilder smoothing of the true range
+
+        Args:
+            prev_atr: Previous ATR value
+            high: New bar high
+            low: New bar low
+            prev_close: Previous bar close
+            period: ATR period (default 14)
+
+        Returns:
+            Updated ATR value
+        """
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        return (prev_atr * (period - 1) + tr) / period
+
+    @staticmethod
+    def _atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int) -> pd.Series:
+        tr = pd.Series(_true_range(high, low, close), index=high.index)
         atr = tr.rolling(window=period).mean()
 
         return atr
@@ -103,12 +451,7 @@ class TechnicalIndicators:
         if len(atr) < 2:
             return 50.0
 
-        current_atr = atr.iloc[-1]
-        historical_atr = atr.iloc[-lookback:] if len(atr) >= lookback else atr
-
-        percentile = (historical_atr < current_atr).sum() / len(historical_atr) * 100
-
-        return percentile
+        return _percentile_rank(atr.to_numpy(dtype=float), lookback)
 
     @staticmethod
     def calculate_adx(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> Tuple[pd.Series, pd.Series, pd.Series]:
@@ -124,6 +467,13 @@ class TechnicalIndicators:
         Returns:
             Tuple of (adx, di_plus, di_minus) Series
         """
+        if njit is not None:
+            adx, plus_di, minus_di = _adx_kernel(
+                high.to_numpy(dtype=float), low.to_numpy(dtype=float), close.to_numpy(dtype=float), period
+            )
+            idx = high.index
+            return pd.Series(adx, index=idx), pd.Series(plus_di, index=idx), pd.Series(minus_di, index=idx)
+
         # Calculate +DM and -DM
         high_diff = high.diff()
         low_diff = -low.diff()
@@ -131,19 +481,59 @@ class TechnicalIndicators:
         plus_dm = high_diff.where((high_diff > low_diff) & (high_diff > 0), 0)
         minus_dm = low_diff.where((low_diff > high_diff) & (low_diff > 0), 0)
 
-        # Calculate ATR
-        atr = TechnicalIndicators.calculate_atr(high, low, close, period)
+        # Wilder smoothing (an EMA with alpha = 1/period) for TR, DM and DX
+        alpha = 1 / period
+        tr = pd.Series(_true_range(high, low, close), index=high.index)
+        atr = tr.ewm(alpha=alpha, adjust=False).mean()
 
         # Calculate +DI and -DI
-        plus_di = 100 * (plus_dm.rolling(window=period).mean() / atr)
-        minus_di = 100 * (minus_dm.rolling(window=period).mean() / atr)
+        plus_di = 100 * (plus_dm.ewm(alpha=alpha, adjust=False).mean() / atr)
+        minus_di = 100 * (minus_dm.ewm(alpha=alpha, adjust=False).mean() / atr)
 
         # Calculate DX and ADX
         dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
-        adx = dx.rolling(window=period).mean()
+        adx = dx.ewm(alpha=alpha, adjust=False).mean()
 
         return adx, plus_di, minus_di
 
+    @staticmethod
+    def calculate_latest(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14,
+                         ema_period: int = 20, fast: int = 12, slow: int = 26,
+                         signal: int = 9) -> Optional[Tuple[Dict[str, float], pd.Series]]:
+        """
+        Latest ADX/DI/RSI/MACD/EMA values and the ATR series in one fused pass
+
+        Matches calculate_adx/rsi/macd/ema/atr with the same periods. Only
+        available with Numba (a pure-Python loop would be slower than the
+        vectorised per-indicator path) and for NaN-free inputs.
+
+        Args:
+            high: Series of high prices
+            low: Series of low prices
+            close: Series of close prices
+            period: ADX/RSI/ATR period (default 14)
+            ema_period: EMA period (default 20)
+            fast: MACD fast EMA period (default 12)
+            slow: MACD slow EMA period (default 26)
+            signal: MACD signal period (default 9)
+
+        Returns:
+            Tuple of (dict of latest values, ATR Series), or None if the fused
+            kernel cannot be used
+        """
+        if njit is None or len(close) == 0:
+            return None
+
+        h = high.to_numpy(dtype=float)
+        l = low.to_numpy(dtype=float)
+        c = close.to_numpy(dtype=float)
+        if np.isnan(h).any() or np.isnan(l).any() or np.isnan(c).any():
+            return None
+
+        last, atr = _fused_kernel(h, l, c, period, ema_period, fast, slow, signal)
+        names = ('adx', 'di_plus', 'di_minus', 'rsi', 'macd', 'macd_signal', 'macd_histogram', 'ema')
+        return dict(zip(names, last.tolist())), pd.Series(atr, index=close.index)
+
     @staticmethod
     def calculate_macd(prices: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[pd.Series, pd.Series, pd.Series]:
         """
@@ -181,10 +571,13 @@ class TechnicalIndicators:
         Returns:
             Series of VWAP values
         """
-        typical_price = (high + low + close) / 3
-        vwap = (typical_price * volume).cumsum() / volume.cumsum()
+        v = volume.to_numpy(dtype=float)
+        tpv = (high.to_numpy(dtype=float) + low.to_numpy(dtype=float) + close.to_numpy(dtype=float)) / 3 * v
 
-        return vwap
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vwap = _cumsum_skipna(tpv) / _cumsum_skipna(v)
+
+        return pd.Series(vwap, index=high.index)
 
     @staticmethod
     def calculate_bollinger_bands(prices: pd.Series, period: int = 20, std_dev: float = 2.0) -> Tuple[pd.Series, pd.Series, pd.Series]:
@@ -199,8 +592,29 @@ class TechnicalIndicators:
         Returns:
             Tuple of (upper_band, middle_band, lower_band) Series
         """
-        middle_band = TechnicalIndicators.calculate_sma(prices, period)
-        std = prices.rolling(window=period).std()
+        x = prices.to_numpy(dtype=float)
+        n = len(x)
+        if n < period or period < 2 or np.isnan(x).any():
+            # Prefix sums propagate NaN past the window; keep pandas' per-window handling
+            middle_band = TechnicalIndicators.calculate_sma(prices, period)
+            std = prices.rolling(window=period).std()
+        else:
+            # Running sum and sum of squares in one pass; centring on the first price
+            # keeps the squares small so var = E[x^2] - E[x]^2 does not lose precision
+            d = x - x[0]
+            cs = np.concatenate(([0.0], np.cumsum(d)))
+            css = np.concatenate(([0.0], np.cumsum(d * d)))
+            win_sum = cs[period:] - cs[:-period]
+            win_sq = css[period:] - css[:-period]
+
+            mean = np.full(n, np.nan)
+            var = np.full(n, np.nan)
+            mean[period - 1:] = win_sum / period + x[0]
+            # Sample variance (ddof=1), as Series.rolling().std()
+            var[period - 1:] = np.maximum(win_sq - win_sum * win_sum / period, 0.0) / (period - 1)
+
+            middle_band = pd.Series(mean, index=prices.index)
+            std = pd.Series(np.sqrt(var), index=prices.index)
 
         upper_band = middle_band + (std * std_dev)
         lower_band = middle_band - (std * std_dev)
@@ -222,12 +636,7 @@ class TechnicalIndicators:
         if len(iv_values) < 2:
             return 50.0
 
-        current_iv = iv_values.iloc[-1]
-        historical_iv = iv_values.iloc[-lookback:] if len(iv_values) >= lookback else iv_values
-
-        percentile = (historical_iv < current_iv).sum() / len(historical_iv) * 100
-
-        return percentile
+        return _percentile_rank(iv_values.to_numpy(dtype=float), lookback)
 
     @staticmethod
     def is_price_above_ema(current_price: float, ema: pd.Series) -> bool:
@@ -264,28 +673,19 @@ class TechnicalIndicators:
         return current_price < ema.iloc[-1]
 
     @staticmethod
-    def detect_ema_crossover(fast_ema: pd.Series, slow_ema: pd.Series) -> str:
+    def detect_crossover(fast_prev: float, fast_now: float, slow_prev: float, slow_now: float) -> str:
         """
-        Detect EMA crossover
+        Detect a crossover from the last two values of each line
 
         Args:
-            fast_ema: Fast EMA series
-            slow_ema: Slow EMA series
+            fast_prev: Previous fast (or MACD) value
+            fast_now: Current fast (or MACD) value
+            slow_prev: Previous slow (or signal) value
+            slow_now: Current slow (or signal) value
 
         Returns:
             'bullish', 'bearish', or 'none'
         """
-        if len(fast_ema) < 2 or len(slow_ema) < 2:
-            return 'none'
-
-        # Current values
-        fast_now = fast_ema.iloc[-1]
-        slow_now = slow_ema.iloc[-1]
-
-        # Previous values
-        fast_prev = fast_ema.iloc[-2]
-        slow_prev = slow_ema.iloc[-2]
-
         # Bullish crossover: fast crosses above slow
         if fast_prev <= slow_prev and fast_now > slow_now:
             return 'bullish'
@@ -296,6 +696,25 @@ class TechnicalIndicators:
 
         return 'none'
 
+    @staticmethod
+    def detect_ema_crossover(fast_ema: pd.Series, slow_ema: pd.Series) -> str:
+        """
+        Detect EMA crossover
+
+        Args:
+            fast_ema: Fast EMA series
+            slow_ema: Slow EMA series
+
+        Returns:
+            'bullish', 'bearish', or 'none'
+        """
+        if len(fast_ema) < 2 or len(slow_ema) < 2:
+            return 'none'
+
+        fast = fast_ema.to_numpy()
+        slow = slow_ema.to_numpy()
+        return TechnicalIndicators.detect_crossover(float(fast[-2]), float(fast[-1]), float(slow[-2]), float(slow[-1]))
+
     @staticmethod
     def detect_macd_crossover(macd_line: pd.Series, signal_line: pd.Series) -> str:
         """
@@ -311,20 +730,6 @@ class TechnicalIndicators:
         if len(macd_line) < 2 or len(signal_line) < 2:
             return 'none'
 
-        # Current values
-        macd_now = macd_line.iloc[-1]
-        signal_now = signal_line.iloc[-1]
-
-        # Previous values
-        macd_prev = macd_line.iloc[-2]
-        signal_prev = signal_line.iloc[-2]
-
-        # Bullish crossover: MACD crosses above signal
-        if macd_prev <= signal_prev and macd_now > signal_now:
-            return 'bullish'
-
-        # Bearish crossover: MACD crosses below signal
-        if macd_prev >= signal_prev and macd_now < signal_now:
-            return 'bearish'
-
-        return 'none'
+        macd = macd_line.to_numpy()
+        signal = signal_line.to_numpy()
+        return TechnicalIndicators.detect_crossover(float(macd[-2]), float(macd[-1]), float(signal[-2]), float(signal[-1]))
@@ -4,14 +4,70 @@ Market Data Feed for MCH Bot 3.0
 Integrates with Zerodha Kite API for real-time market data
 """
 
+import asyncio
+import json
 import logging
+import threading
+import time as _time
+from collections import defaultdict
+import numpy as np
 import pandas as pd
-from datetime import datetime, time, timedelta
-from typing import Dict, Optional, List
-from kiteconnect import KiteConnect
-import pytz
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional, List, Tuple
+from kiteconnect import KiteConnect, KiteTicker
+from zoneinfo import ZoneInfo
 
-from momentum_bot.data.indicators import TechnicalIndicators
+from momentum_bot.data.indicators import RollingPercentile, TechnicalIndicators
+
+# (exchange, date) -> (tradingsymbol map, name map), shared by every MarketDataFeed
+_instrument_index: Dict[Tuple[str, str], Tuple[Dict[str, List[int]], Dict[str, List[int]]]] = {}
+_instrument_lock = threading.Lock()
+
+
+def _load_instrument_index(kite, exchange: str, day: str, cache_file: Path):
+    """
+    Build tradingsymbol/name -> [row, token] maps for an exchange's instruments
+
+    The maps are shared across feeds and persisted for the trading day, so the
+    full instruments dump is downloaded at most once per day per process.
+    """
+    key = (exchange, day)
+    with _instrument_lock:
+        if key in _instrument_index:
+            return _instrument_index[key]
+
+        index = None
+        try:
+            cached = json.loads(cache_file.read_text())
+            if cached.get('date') == day:
+                index = (cached['by_tsym'], cached['by_name'])
+        except (OSError, ValueError, KeyError):
+            pass
+
+        if index is None:
+            by_tsym: Dict[str, List[int]] = {}
+            by_name: Dict[str, List[int]] = {}
+            for row, inst in enumerate(kite.instruments(exchange)):
+                entry = [row, inst['instrument_token']]
+                tsym = inst.get('tradingsymbol')
+                name = inst.get('name')
+                if tsym is not None:
+                    by_tsym.setdefault(tsym, entry)
+                if name is not None:
+                    by_name.setdefault(name, entry)
+            index = (by_tsym, by_name)
+
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps({'date': day, 'by_tsym': by_tsym, 'by_name': by_name}))
+            except OSError as e:
+                logging.getLogger(__name__).warning(f"Could not write instruments cache: {e}")
+
+        # Only the current day's maps are worth keeping
+        _instrument_index.clear()
+        _instrument_index[key] = index
+        return index
 
 
 class MarketDataFeed:
@@ -26,6 +82,16 @@ class MarketDataFeed:
     - Calculated technical indicators
     """
 
+    VIX_SYMBOL = "NSE:INDIA VIX"
+
+    # Per-day NSE instrument lookup maps (tradingsymbol/name -> [row, token])
+    INSTRUMENTS_CACHE = Path.home() / ".cache" / "mch_bot" / "instruments_nse.json"
+
+    HISTORY_TTL_S = 3600.0
+
+    # Ticker prices older than this fall back to a REST quote (feed stalled/disconnected)
+    TICK_MAX_AGE_S = 10.0
+
     def __init__(self, config):
         """
         Initialize market data feed
@@ -48,42 +114,145 @@ class MarketDataFeed:
             self.kite = None
             self.logger.warning("Kite API not configured - using demo mode")
 
-        # Cache for historical data
-        self.historical_cache = {}
-        self.cache_expiry = {}
+        # Demo mode is fixed for the feed's lifetime, so bind the demo data
+        # sources once instead of branching on self.kite in every call
+        if self.kite is None:
+            self.get_spot_price = self._demo_spot_price
+            self.get_vix = self._demo_vix
+            self._get_spot_and_vix = self._demo_spot_and_vix
+            self.get_historical_data = self._demo_historical_data
+            self.get_option_premium = self._demo_option_premium
+
+        # Cache for historical data: key -> (monotonic expiry, DataFrame), with one
+        # lock per key so concurrent misses share a single Kite fetch
+        self.historical_cache: Dict[Tuple[str, int, str], Tuple[float, pd.DataFrame]] = {}
+        self._fetch_locks: Dict[Tuple[str, int, str], asyncio.Lock] = defaultdict(asyncio.Lock)
 
         # Instrument tokens (will be fetched dynamically)
         self.instrument_tokens = {}
+        self._inst_by_tsym: Dict[str, List[int]] = {}
+        self._inst_by_name: Dict[str, List[int]] = {}
+        self._inst_day: Optional[str] = None
 
         # Timezone
-        self.tz = pytz.timezone(config.market_timezone)
+        self.tz = ZoneInfo(config.market_timezone)
+
+        # Demo mode: one Generator for the process (fresh bars every call) and the
+        # date index per window length, rebuilt when the day changes
+        self._demo_rng = np.random.default_rng()
+        self._demo_index: Dict[int, Tuple[date, pd.DatetimeIndex]] = {}
+
+        # is_market_open() result for the current epoch minute
+        self._market_open_minute = -1
+        self._market_open_cached = False
+
+        # ATR of completed bars, kept sorted across history refreshes for the percentile
+        self._atr_window = RollingPercentile(lookback=252)
+        self._atr_fed_through = None
 
-    def is_market_open(self) -> bool:
+        # Last indicator result and the history bar it was computed from
+        self._indicator_key = None
+        self._indicator_cache: Optional[Dict] = None
+
+        # WebSocket ticker state: token -> (last_price, monotonic receive time)
+        self._ticker = None
+        self._last_prices: Dict[int, Tuple[float, float]] = {}
+        self._spot_token: Optional[int] = None
+        self._vix_token: Optional[int] = None
+
+    async def start_ticker(self):
+        """
+        Stream spot and VIX last prices over the Kite WebSocket ticker
+
+        Once running, spot/VIX reads come from the in-memory price table and
+        only fall back to REST quotes while the feed is stale.
+        """
+        if self.kite is None or self._ticker is not None or not self.config.kite_access_token:
+            return
+
+        self._spot_token = await self._get_instrument_token(self.config.instrument_underlying_symbol)
+        self._vix_token = await self._get_instrument_token(self.VIX_SYMBOL)
+        tokens = [t for t in (self._spot_token, self._vix_token) if t]
+        if not tokens:
+            self.logger.warning("No instrument tokens for ticker - using REST quotes")
+            return
+
+        ticker = KiteTicker(self.config.kite_api_key, self.config.kite_access_token)
+
+        def on_connect(ws, response):
+            ws.subscribe(tokens)
+            ws.set_mode(ws.MODE_LTP, tokens)
+
+        def on_ticks(ws, ticks):
+            now = _time.monotonic()
+            for tick in ticks:
+                self._last_prices[tick['instrument_token']] = (tick['last_price'], now)
+
+        ticker.on_connect = on_connect
+        ticker.on_ticks = on_ticks
+        ticker.connect(threaded=True)
+        self._ticker = ticker
+        self.logger.info(f"Kite ticker started for tokens {tokens}")
+
+    def stop_ticker(self):
+        """Close the WebSocket ticker if running"""
+        if self._ticker is not None:
+            try:
+                self._ticker.close()
+            except Exception as e:
+                self.logger.error(f"Error closing ticker: {e}")
+            self._ticker = None
+
+    def _ticker_price(self, token: Optional[int]) -> Optional[float]:
+        """Last streamed price for token, or None if missing or stale"""
+        entry = self._last_prices.get(token)
+        if entry is None or _time.monotonic() - entry[1] > self.TICK_MAX_AGE_S:
+            return None
+        return entry[0]
+
+    def is_market_open(self, now: Optional[datetime] = None) -> bool:
         """
         Check if market is currently open
 
+        Args:
+            now: Tick time in the market timezone (default: current time)
+
         Returns:
             True if market is open
         """
-        now = datetime.now(self.tz)
+        if now is not None:
+            return self._check_market_open(now)
+
+        # Open/close fall on minute boundaries, so the answer holds for the whole minute
+        # (the market timezone offset is whole minutes, so epoch minutes line up)
+        minute = int(_time.time() // 60)
+        if minute == self._market_open_minute:
+            return self._market_open_cached
+
+        self._market_open_minute = minute
+        self._market_open_cached = self._check_market_open()
+        return self._market_open_cached
+
+    def _check_market_open(self, now: Optional[datetime] = None) -> bool:
+        if now is None:
+            now = datetime.now(self.tz)
 
         # Check if weekend
         if now.weekday() >= 5:  # Saturday=5, Sunday=6
             return False
 
-        # Parse market hours
-        open_time = time.fromisoformat(self.config.market_open)
-        close_time = time.fromisoformat(self.config.market_close)
-
         # Check if within market hours
         current_time = now.time()
 
-        return open_time <= current_time <= close_time
+        return self.config.market_open_time <= current_time <= self.config.market_close_time
 
-    async def get_latest(self) -> Dict:
+    async def get_latest(self, now: Optional[datetime] = None) -> Dict:
         """
         Get latest market data with all indicators
 
+        Args:
+            now: Tick time used as the snapshot timestamp (default: current time)
+
         Returns:
             Dict containing:
                 - spot: Current spot price
@@ -101,30 +270,21 @@ class MarketDataFeed:
                 - iv_percentile: IV percentile
                 - timestamp: Data timestamp
         """
-        # Get spot price
-        spot = await self.get_spot_price()
-
-        # Get VIX
-        vix = await self.get_vix()
-
-        # Get historical data for indicators (60 days)
-        hist_data = await self.get_historical_data(
-            symbol=self.config.instrument_symbol,
-            days=60
+        # Spot + VIX (one batched quote) and 60 days of history, fetched concurrently
+        (spot, vix), hist_data = await asyncio.gather(
+            self._get_spot_and_vix(),
+            self.get_historical_data(symbol=self.config.instrument_symbol, days=60)
         )
 
         # Calculate indicators
         indicators = self._calculate_all_indicators(hist_data, spot)
 
-        # Combine all data
-        market_data = {
-            'spot': spot,
-            'vix': vix,
-            'timestamp': datetime.now(self.tz),
-            **indicators
-        }
+        # Combine all data (indicators is a fresh dict per call, so fill it in place)
+        indicators['spot'] = spot
+        indicators['vix'] = vix
+        indicators['timestamp'] = now if now is not None else datetime.now(self.tz)
 
-        return market_data
+        return indicators
 
     async def get_spot_price(self) -> float:
         """
@@ -133,19 +293,13 @@ class MarketDataFeed:
         Returns:
             Current spot price
         """
-        if self.kite is None:
-            # Demo mode
-            return self.config.get('demo.spot', 23500)
+        price = self._ticker_price(self._spot_token)
+        if price is not None:
+            return price
 
         try:
-            symbol = self.config.instrument_underlying_symbol
-            quote = self.kite.quote(symbol)
-
-            if symbol in quote:
-                return quote[symbol]['last_price']
-            else:
-                self.logger.error(f"Quote not found for {symbol}")
-                return 0.0
+            quote = await self._batch_quote([self.config.instrument_underlying_symbol])
+            return self._spot_from_quote(quote)
 
         except Exception as e:
             self.logger.error(f"Error fetching spot price: {e}")
@@ -158,24 +312,59 @@ class MarketDataFeed:
         Returns:
             Current VIX value
         """
-        if self.kite is None:
-            # Demo mode
-            return self.config.get('demo.iv', 0.18) * 100
+        price = self._ticker_price(self._vix_token)
+        if price is not None:
+            return price
 
         try:
-            vix_symbol = "NSE:INDIA VIX"
-            quote = self.kite.quote(vix_symbol)
-
-            if vix_symbol in quote:
-                return quote[vix_symbol]['last_price']
-            else:
-                self.logger.error("VIX quote not found")
-                return 15.0  # Default value
+            quote = await self._batch_quote([self.VIX_SYMBOL])
+            return self._vix_from_quote(quote)
 
         except Exception as e:
             self.logger.error(f"Error fetching VIX: {e}")
             return 15.0
 
+    async def _get_spot_and_vix(self) -> Tuple[float, float]:
+        """
+        Get spot price and VIX with a single quote request
+
+        Returns:
+            Tuple of (spot, vix)
+        """
+        spot = self._ticker_price(self._spot_token)
+        vix = self._ticker_price(self._vix_token)
+        if spot is not None and vix is not None:
+            return spot, vix
+
+        try:
+            quote = await self._batch_quote([self.config.instrument_underlying_symbol, self.VIX_SYMBOL])
+        except Exception as e:
+            self.logger.error(f"Error fetching spot/VIX quotes: {e}")
+            return 0.0, 15.0
+
+        return self._spot_from_quote(quote), self._vix_from_quote(quote)
+
+    async def _kite_call(self, fn, *args, **kwargs):
+        """Run a blocking KiteConnect REST call in a worker thread so the event loop stays free"""
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def _batch_quote(self, symbols: List[str]) -> Dict:
+        """Fetch quotes for several instruments in one call"""
+        return await self._kite_call(self.kite.quote, symbols)
+
+    def _spot_from_quote(self, quote: Dict) -> float:
+        symbol = self.config.instrument_underlying_symbol
+        if symbol in quote:
+            return quote[symbol]['last_price']
+        self.logger.error(f"Quote not found for {symbol}")
+        return 0.0
+
+    def _vix_from_quote(self, quote: Dict) -> float:
+        if self.VIX_SYMBOL in quote:
+            return quote[self.VIX_SYMBOL]['last_price']
+        self.logger.error("VIX quote not found")
+        return 15.0  # Default value
+
     async def get_historical_data(
         self,
         symbol: str,
@@ -193,17 +382,21 @@ class MarketDataFeed:
         Returns:
             DataFrame with OHLCV data
         """
-        # Check cache
-        cache_key = f"{symbol}_{days}_{interval}"
-        if cache_key in self.historical_cache:
-            expiry = self.cache_expiry.get(cache_key)
-            if expiry and datetime.now() < expiry:
-                return self.historical_cache[cache_key]
-
-        if self.kite is None:
-            # Demo mode - generate synthetic data
-            return self._generate_demo_data(days)
+        cache_key = (symbol, days, interval)
+        async with self._fetch_locks[cache_key]:
+            # Check cache (a waiter finds the entry its predecessor just stored)
+            entry = self.historical_cache.get(cache_key)
+            if entry is not None and _time.monotonic() < entry[0]:
+                return entry[1]
+
+            df = await self._fetch_historical_data(symbol, days, interval)
+            if not df.empty:
+                # Cache for 1 hour
+                self.historical_cache[cache_key] = (_time.monotonic() + self.HISTORY_TTL_S, df)
+            return df
 
+    async def _fetch_historical_data(self, symbol: str, days: int, interval: str) -> pd.DataFrame:
+        """Fetch OHLCV candles from Kite (uncached); empty DataFrame on failure"""
         try:
             # Get instrument token
             instrument_token = await self._get_instrument_token(symbol)
@@ -213,23 +406,23 @@ class MarketDataFeed:
             from_date = to_date - timedelta(days=days)
 
             # Fetch historical data
-            historical = self.kite.historical_data(
+            historical = await self._kite_call(
+                self.kite.historical_data,
                 instrument_token=instrument_token,
                 from_date=from_date,
                 to_date=to_date,
                 interval=interval
             )
 
-            # Convert to DataFrame
-            df = pd.DataFrame(historical)
-            df['date'] = pd.to_datetime(df['date'])
-            df.set_index('date', inplace=True)
-
-            # Cache for 1 hour
-            self.historical_cache[cache_key] = df
-            self.cache_expiry[cache_key] = datetime.now() + timedelta(hours=1)
+            if not historical:
+                self.logger.error(f"No historical data returned for {symbol}")
+                return pd.DataFrame()
 
-            return df
+            # Convert to DataFrame column-wise; building from row dicts goes through
+            # pandas' slower per-record inference
+            columns = {key: [bar[key] for bar in historical] for key in historical[0]}
+            index = pd.DatetimeIndex(columns.pop('date'), name='date')
+            return pd.DataFrame(columns, index=index)
 
         except Exception as e:
             self.logger.error(f"Error fetching historical data: {e}")
@@ -250,6 +443,13 @@ class MarketDataFeed:
             self.logger.warning("Insufficient historical data for indicators")
             return self._default_indicators()
 
+        # History only changes when a new bar arrives (daily bars, cached for an hour),
+        # so ticks in between reuse the previous result instead of rescanning the window
+        last = hist_data.iloc[-1]
+        key = (len(hist_data), hist_data.index[-1], last['high'], last['low'], last['close'])
+        if key == self._indicator_key:
+            return dict(self._indicator_cache)
+
         try:
             # Extract OHLCV
             close = hist_data['close']
@@ -257,18 +457,39 @@ class MarketDataFeed:
             low = hist_data['low']
             volume = hist_data.get('volume', pd.Series([0] * len(hist_data)))
 
+            # One fused pass over the bars when Numba is available
+            fused = TechnicalIndicators.calculate_latest(high, low, close, ema_period=20)
+            if fused is not None:
+                latest, atr = fused
+                indicators = {
+                    'adx': latest['adx'],
+                    'di_plus': latest['di_plus'],
+                    'di_minus': latest['di_minus'],
+                    'rsi': latest['rsi'],
+                    'macd': latest['macd'],
+                    'macd_signal': latest['macd_signal'],
+                    'macd_histogram': latest['macd_histogram'],
+                    'ema_20': latest['ema'],
+                    'atr': atr.iloc[-1],
+                    'atr_percentile': self._atr_percentile(atr),
+                    'iv_percentile': 50.0
+                }
+                self._indicator_key = key
+                self._indicator_cache = indicators
+                return dict(indicators)
+
             # Calculate indicators
             adx, di_plus, di_minus = TechnicalIndicators.calculate_adx(high, low, close)
             rsi = TechnicalIndicators.calculate_rsi(close)
             macd_line, signal_line, histogram = TechnicalIndicators.calculate_macd(close)
             ema_20 = TechnicalIndicators.calculate_ema(close, 20)
             atr = TechnicalIndicators.calculate_atr(high, low, close)
-            atr_percentile = TechnicalIndicators.calculate_atr_percentile(atr)
+            atr_percentile = self._atr_percentile(atr)
 
             # IV percentile (placeholder - would need option data)
             iv_percentile = 50.0  # Default
 
-            return {
+            indicators = {
                 'adx': adx.iloc[-1] if not adx.empty else 20.0,
                 'di_plus': di_plus.iloc[-1] if not di_plus.empty else 20.0,
                 'di_minus': di_minus.iloc[-1] if not di_minus.empty else 20.0,
@@ -281,11 +502,38 @@ class MarketDataFeed:
                 'atr_percentile': atr_percentile,
                 'iv_percentile': iv_percentile
             }
+            self._indicator_key = key
+            self._indicator_cache = indicators
+            return dict(indicators)
 
         except Exception as e:
             self.logger.error(f"Error calculating indicators: {e}")
             return self._default_indicators()
 
+    def _atr_percentile(self, atr: pd.Series) -> float:
+        """
+        Percentile of the latest ATR against the last 252 completed bars
+
+        Completed bars (all but the still-forming last one) are pushed into the
+        sorted window once each, so a query is a binary search rather than a
+        pass over the series; NaN warm-up values are ignored.
+
+        Args:
+            atr: Series of ATR values
+
+        Returns:
+            ATR percentile (0-100)
+        """
+        completed = atr.iloc[:-1]
+        if self._atr_fed_through is not None:
+            completed = completed[completed.index > self._atr_fed_through]
+        for value in completed.to_numpy(dtype=float):
+            self._atr_window.update(value)
+        if len(completed):
+            self._atr_fed_through = completed.index[-1]
+
+        return self._atr_window.rank(float(atr.iloc[-1]))
+
     def _default_indicators(self) -> Dict:
         """Return default indicator values when calculation fails"""
         return {
@@ -302,22 +550,48 @@ class MarketDataFeed:
             'iv_percentile': 50.0
         }
 
-    def _generate_demo_data(self, days: int) -> pd.DataFrame:
-        """Generate synthetic data for demo mode"""
-        import numpy as np
+    # Demo mode data sources (bound over the live methods in __init__)
+    async def _demo_spot_price(self) -> float:
+        return self.config.get('demo.spot', 23500)
+
+    async def _demo_vix(self) -> float:
+        return self.config.get('demo.iv', 0.18) * 100
+
+    async def _demo_spot_and_vix(self) -> Tuple[float, float]:
+        return await self._demo_spot_price(), await self._demo_vix()
+
+    async def _demo_historical_data(self, symbol: str, days: int = 60, interval: str = "day") -> pd.DataFrame:
+        # Generate synthetic data
+        return self._generate_demo_data(days)
+
+    async def _demo_option_premium(self, strike: int, expiry: str, option_type: str) -> float:
+        # Simple BSM approximation
+        spot = await self._demo_spot_price()
+        otm_distance = abs(strike - spot)
+        return max(50, 500 - otm_distance * 1.5)
 
-        dates = pd.date_range(end=datetime.now(), periods=days, freq='D')
+    def _generate_demo_data(self, days: int) -> pd.DataFrame:
+        """Generate synthetic data for demo mode (new random bars on every call)"""
+        now = datetime.now()
+        cached = self._demo_index.get(days)
+        if cached is None or cached[0] != now.date():
+            cached = (now.date(), pd.date_range(end=now, periods=days, freq='D'))
+            self._demo_index[days] = cached
+        dates = cached[1]
+        rng = self._demo_rng
 
         # Generate random walk for prices
-        returns = np.random.normal(0.001, 0.02, days)
-        prices = 23500 * (1 + returns).cumprod()
+        prices = 23500 * (1 + rng.normal(0.001, 0.02, days)).cumprod()
+
+        # One uniform draw feeds the open/high/low bands and volume
+        u = rng.random((days, 4))
 
         df = pd.DataFrame({
-            'open': prices * np.random.uniform(0.995, 1.005, days),
-            'high': prices * np.random.uniform(1.005, 1.015, days),
-            'low': prices * np.random.uniform(0.985, 0.995, days),
+            'open': prices * (0.995 + 0.01 * u[:, 0]),
+            'high': prices * (1.005 + 0.01 * u[:, 1]),
+            'low': prices * (0.985 + 0.01 * u[:, 2]),
             'close': prices,
-            'volume': np.random.randint(100000, 1000000, days)
+            'volume': (100000 + 900000 * u[:, 3]).astype(np.int64)
         }, index=dates)
 
         return df
@@ -340,22 +614,27 @@ class MarketDataFeed:
             return 0
 
         try:
-            # Fetch instruments
-            instruments = self.kite.instruments("NSE")
+            await self._load_instrument_index()
 
             # Find matching instrument
             search_symbol = symbol.split(':')[-1].replace(' 50', '').strip()
 
-            for inst in instruments:
-                # Check both tradingsymbol and name fields
-                if (inst.get('tradingsymbol') == search_symbol or
-                    inst.get('name') == symbol or
-                    inst.get('name') == search_symbol or
-                    (search_symbol == 'NIFTY' and inst.get('name') == 'NIFTY 50')):
-                    token = inst['instrument_token']
-                    self.instrument_tokens[symbol] = token
-                    self.logger.info(f"Found instrument token for {symbol}: {token}")
-                    return token
+            # Check both tradingsymbol and name fields; the earliest row in the
+            # instruments dump wins, as with a linear scan
+            candidates = [
+                self._inst_by_tsym.get(search_symbol),
+                self._inst_by_name.get(symbol),
+                self._inst_by_name.get(search_symbol),
+            ]
+            if search_symbol == 'NIFTY':
+                candidates.append(self._inst_by_name.get('NIFTY 50'))
+            hits = [c for c in candidates if c is not None]
+
+            if hits:
+                token = min(hits)[1]
+                self.instrument_tokens[symbol] = token
+                self.logger.info(f"Found instrument token for {symbol}: {token}")
+                return token
 
             self.logger.error(f"Instrument token not found for {symbol}")
             return 0
@@ -364,6 +643,26 @@ class MarketDataFeed:
             self.logger.error(f"Error fetching instrument token: {e}")
             return 0
 
+    async def prefetch_instruments(self):
+        """Load the instrument lookup maps up front so no dump is fetched mid-session"""
+        if self.kite is None:
+            return
+        try:
+            await self._load_instrument_index()
+        except Exception as e:
+            self.logger.error(f"Error prefetching instruments: {e}")
+
+    async def _load_instrument_index(self):
+        """Point this feed at today's shared NSE lookup maps, loading them if needed"""
+        today = datetime.now(self.tz).date().isoformat()
+        if self._inst_day == today:
+            return
+
+        self._inst_by_tsym, self._inst_by_name = await asyncio.to_thread(
+            _load_instrument_index, self.kite, "NSE", today, self.INSTRUMENTS_CACHE
+        )
+        self._inst_day = today
+
     async def get_option_premium(
         self,
         strike: int,
@@ -381,17 +680,11 @@ class MarketDataFeed:
         Returns:
             Current option premium
         """
-        if self.kite is None:
-            # Demo mode - simple BSM approximation
-            spot = await self.get_spot_price()
-            otm_distance = abs(strike - spot)
-            return max(50, 500 - otm_distance * 1.5)
-
         try:
             # Construct tradingsymbol
             symbol = f"NFO:NIFTY{expiry}{strike}{option_type}"
 
-            quote = self.kite.quote(symbol)
+            quote = await self._kite_call(self.kite.quote, symbol)
 
             if symbol in quote:
                 return quote[symbol]['last_price']
@@ -5,13 +5,40 @@ Integrates with Zerodha Kite API for order execution
 Supports both paper trading and live trading modes
 """
 
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
+import asyncio
+import json
 import logging
 
+import numpy as np
+
 from momentum_bot.core.constants import OrderSide, BrokerMode
 
 
+@dataclass(slots=True, frozen=True)
+class PaperOrder:
+    """Simulated fill kept in the paper order book"""
+    order_id: str
+    position_id: str
+    symbol: str
+    side: str
+    quantity: int
+    order_price: float
+    fill_price: float
+    brokerage: float
+    timestamp: datetime
+    gross_pnl: float = 0.0
+    tax: float = 0.0
+    net_pnl: float = 0.0
+    is_close: bool = False
+
+
 class BrokerInterface:
     """
     Broker interface for order execution
@@ -23,6 +50,11 @@ class BrokerInterface:
     - Position tracking
     """
 
+    # Paper order book bound; older fills are spilled to disk in batches
+    MAX_PAPER_ORDERS = 10_000
+    PAPER_SPILL_BATCH = 1_000
+    PAPER_SPILL_FILE = Path('logs') / 'paper_orders_evicted.jsonl'
+
     def __init__(self, config):
         """
         Initialize broker interface
@@ -43,9 +75,21 @@ class BrokerInterface:
             self.kite = None
             self.logger.info("Paper trading mode enabled")
 
-        # Paper trading state
-        self.paper_orders = {}
+        # Paper vs live is fixed after init, so bind the paper entry points once
+        # instead of branching on every order
+        if self.kite is None or self.dry_run:
+            self.place_order = self._paper_place_order
+            self.close_position = self._paper_close_position
+
+        # Paper trading state: bounded order book by id (oldest first), plus parallel
+        # columns for aggregation whose first _paper_evicted entries are already evicted
+        self.paper_orders: OrderedDict[str, PaperOrder] = OrderedDict()
         self.paper_order_counter = 0
+        self._paper_fill_prices = array('d')
+        self._paper_net_pnls = array('d')
+        self._paper_evicted = 0
+        self._paper_spill: List[PaperOrder] = []
+        self._spill_executor: Optional[ThreadPoolExecutor] = None
 
         self.logger.info(
             f"BrokerInterface initialized: "
@@ -73,7 +117,7 @@ class BrokerInterface:
             self.logger.warning("Falling back to paper trading mode")
             self.kite = None
 
-    async def place_order(self, position: Dict) -> Dict:
+    async def place_order(self, position: Dict, now: Optional[datetime] = None) -> Dict:
         """
         Place order for new position
 
@@ -85,20 +129,20 @@ class BrokerInterface:
                 - option_type: 'CALL' or 'PUT'
                 - quantity: Order quantity
                 - entry_premium: Limit price
+            now: Tick time stamped on the order (default: current time)
 
         Returns:
             Order result dict
         """
-        if self.kite is None or self.dry_run:
-            return self._place_paper_order(position, OrderSide.BUY)
-        else:
-            return self._place_kite_order(position, OrderSide.BUY)
+        # KiteConnect is blocking; keep the order round-trip off the event loop
+        return await asyncio.to_thread(self._place_kite_order, position, OrderSide.BUY, now)
 
     async def close_position(
         self,
         position: Dict,
         quantity: int,
-        exit_premium: float
+        exit_premium: float,
+        now: Optional[datetime] = None
     ) -> Dict:
         """
         Close position (sell)
@@ -107,22 +151,33 @@ class BrokerInterface:
             position: Position dict
             quantity: Quantity to sell
             exit_premium: Limit price
+            now: Tick time stamped on the order (default: current time)
 
         Returns:
             Order result dict
         """
-        if self.kite is None or self.dry_run:
-            return self._close_paper_position(position, quantity, exit_premium)
-        else:
-            return self._close_kite_position(position, quantity, exit_premium)
+        return await asyncio.to_thread(self._close_kite_position, position, quantity, exit_premium, now)
 
-    def _place_paper_order(self, position: Dict, side: OrderSide) -> Dict:
+    async def _paper_place_order(self, position: Dict, now: Optional[datetime] = None) -> Dict:
+        return self._place_paper_order(position, OrderSide.BUY, now)
+
+    async def _paper_close_position(
+        self,
+        position: Dict,
+        quantity: int,
+        exit_premium: float,
+        now: Optional[datetime] = None
+    ) -> Dict:
+        return self._close_paper_position(position, quantity, exit_premium, now)
+
+    def _place_paper_order(self, position: Dict, side: OrderSide, now: Optional[datetime] = None) -> Dict:
         """
         Simulate order placement (paper trading)
 
         Args:
             position: Position dict
             side: Order side (BUY/SELL)
+            now: Order timestamp (default: current time)
 
         Returns:
             Simulated order result
@@ -141,12 +196,13 @@ class BrokerInterface:
 
         # Simulate brokerage
         brokerage = self.config.execution_brokerage_per_order
+        symbol = self._construct_symbol(position)
 
         order_result = {
             'success': True,
             'order_id': order_id,
             'position_id': position.get('position_id', 'unknown'),
-            'symbol': self._construct_symbol(position),
+            'symbol': symbol,
             'side': side.value,
             'quantity': position['quantity'],
             'order_price': entry_premium,
@@ -154,27 +210,38 @@ class BrokerInterface:
             'slippage': fill_price - entry_premium,
             'slippage_pct': slippage_rate * 100,
             'brokerage': brokerage,
-            'timestamp': datetime.now(),
+            'timestamp': now or datetime.now(),
             'mode': 'PAPER'
         }
 
-        self.paper_orders[order_id] = order_result
+        self._record_paper_order(PaperOrder(
+            order_id=order_id,
+            position_id=order_result['position_id'],
+            symbol=symbol,
+            side=side.value,
+            quantity=position['quantity'],
+            order_price=entry_premium,
+            fill_price=fill_price,
+            brokerage=brokerage,
+            timestamp=order_result['timestamp']
+        ))
 
         self.logger.info(
             f"[PAPER] Order placed: {order_id} | "
-            f"{side.value} {position['quantity']} x {self._construct_symbol(position)} "
+            f"{side.value} {position['quantity']} x {symbol} "
             f"@ Rs.{fill_price:.2f} (slippage: {slippage_rate*100:.1f}%)"
         )
 
         return order_result
 
-    def _place_kite_order(self, position: Dict, side: OrderSide) -> Dict:
+    def _place_kite_order(self, position: Dict, side: OrderSide, now: Optional[datetime] = None) -> Dict:
         """
         Place order via Kite API (live trading)
 
         Args:
             position: Position dict
             side: Order side
+            now: Order timestamp (default: current time)
 
         Returns:
             Order result dict
@@ -204,7 +271,7 @@ class BrokerInterface:
                 'side': side.value,
                 'quantity': position['quantity'],
                 'order_price': position['entry_premium'],
-                'timestamp': datetime.now(),
+                'timestamp': now or datetime.now(),
                 'mode': 'LIVE'
             }
 
@@ -228,7 +295,8 @@ class BrokerInterface:
         self,
         position: Dict,
         quantity: int,
-        exit_premium: float
+        exit_premium: float,
+        now: Optional[datetime] = None
     ) -> Dict:
         """
         Close paper position
@@ -237,6 +305,7 @@ class BrokerInterface:
             position: Position dict
             quantity: Quantity to close
             exit_premium: Exit price
+            now: Order timestamp (default: current time)
 
         Returns:
             Close order result
@@ -261,12 +330,13 @@ class BrokerInterface:
             tax = gross_pnl * self.config.execution_tax_rate
 
         net_pnl = gross_pnl - brokerage - tax
+        symbol = self._construct_symbol(position)
 
         order_result = {
             'success': True,
             'order_id': order_id,
             'position_id': position.get('position_id', 'unknown'),
-            'symbol': self._construct_symbol(position),
+            'symbol': symbol,
             'side': OrderSide.SELL.value,
             'quantity': quantity,
             'order_price': exit_premium,
@@ -276,24 +346,97 @@ class BrokerInterface:
             'brokerage': brokerage,
             'tax': tax,
             'net_pnl': net_pnl,
-            'timestamp': datetime.now(),
+            'timestamp': now or datetime.now(),
             'mode': 'PAPER'
         }
 
+        self._record_paper_order(PaperOrder(
+            order_id=order_id,
+            position_id=order_result['position_id'],
+            symbol=symbol,
+            side=OrderSide.SELL.value,
+            quantity=quantity,
+            order_price=exit_premium,
+            fill_price=fill_price,
+            brokerage=brokerage,
+            timestamp=order_result['timestamp'],
+            gross_pnl=gross_pnl,
+            tax=tax,
+            net_pnl=net_pnl,
+            is_close=True
+        ))
+
         self.logger.info(
             f"[PAPER] Position closed: {order_id} | "
-            f"SELL {quantity} x {self._construct_symbol(position)} "
+            f"SELL {quantity} x {symbol} "
             f"@ Rs.{fill_price:.2f} | "
             f"P&L: Rs.{net_pnl:,.0f} (after costs)"
         )
 
         return order_result
 
+    def _record_paper_order(self, order: PaperOrder):
+        """Add a simulated fill to the paper order book"""
+        self.paper_orders[order.order_id] = order
+        self._paper_fill_prices.append(order.fill_price)
+        self._paper_net_pnls.append(order.net_pnl)
+
+        if len(self.paper_orders) > self.MAX_PAPER_ORDERS:
+            _, evicted = self.paper_orders.popitem(last=False)
+            self._paper_spill.append(evicted)
+            self._paper_evicted += 1
+            if len(self._paper_spill) >= self.PAPER_SPILL_BATCH:
+                self._spill_paper_orders()
+
+    def _spill_paper_orders(self):
+        """Hand evicted paper orders to the writer thread and trim the columns"""
+        batch, self._paper_spill = self._paper_spill, []
+        if self._spill_executor is None:
+            # Single worker keeps batches in eviction order
+            self._spill_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="paper-spill")
+        self._spill_executor.submit(self._write_paper_orders, batch)
+
+        # Fold the evicted P&L into one slot so the total is unchanged
+        evicted_pnl = float(np.frombuffer(self._paper_net_pnls, dtype=np.float64)[:self._paper_evicted].sum())
+        del self._paper_fill_prices[:self._paper_evicted - 1]
+        del self._paper_net_pnls[:self._paper_evicted - 1]
+        self._paper_fill_prices[0] = np.nan
+        self._paper_net_pnls[0] = evicted_pnl
+        self._paper_evicted = 1
+
+    def _write_paper_orders(self, batch: List[PaperOrder]):
+        """Append evicted paper orders to the spill file (runs on the writer thread)"""
+        try:
+            self.PAPER_SPILL_FILE.parent.mkdir(exist_ok=True)
+            with open(self.PAPER_SPILL_FILE, 'a') as f:
+                for order in batch:
+                    f.write(json.dumps(asdict(order), default=str) + '\n')
+        except Exception as e:
+            self.logger.error(f"Failed to spill paper orders: {e}")
+
+    def close(self):
+        """Spill any remaining evicted paper orders and wait for the writer thread (safe to call more than once)"""
+        if self._paper_spill:
+            self._spill_paper_orders()
+        if self._spill_executor is not None:
+            self._spill_executor.shutdown(wait=True)
+            self._spill_executor = None
+
+    def get_paper_net_pnl(self) -> float:
+        """
+        Total net P&L across all paper fills
+
+        Returns:
+            Sum of net P&L (entries contribute 0)
+        """
+        return float(np.frombuffer(self._paper_net_pnls, dtype=np.float64).sum())
+
     def _close_kite_position(
         self,
         position: Dict,
         quantity: int,
-        exit_premium: float
+        exit_premium: float,
+        now: Optional[datetime] = None
     ) -> Dict:
         """
         Close position via Kite API
@@ -302,6 +445,7 @@ class BrokerInterface:
             position: Position dict
             quantity: Quantity to close
             exit_premium: Exit price
+            now: Order timestamp (default: current time)
 
         Returns:
             Order result dict
@@ -309,7 +453,8 @@ class BrokerInterface:
         # Similar to _place_kite_order but with SELL side
         return self._place_kite_order(
             {**position, 'quantity': quantity, 'entry_premium': exit_premium},
-            OrderSide.SELL
+            OrderSide.SELL,
+            now
         )
 
     def _construct_symbol(self, position: Dict) -> str:
@@ -324,12 +469,11 @@ class BrokerInterface:
         Returns:
             Trading symbol
         """
-        instrument = position['instrument']
-        expiry_str = position['expiry_str']
-        strike = position['strike']
-        option_type = position['option_type']
-
-        symbol = f"{instrument}{expiry_str}{strike}{option_type}"
+        # Memoized on the position: entry, exits and logging all need the same symbol
+        symbol = position.get('_symbol')
+        if symbol is None:
+            symbol = f"{position['instrument']}{position['expiry_str']}{position['strike']}{position['option_type']}"
+            position['_symbol'] = symbol
 
         return symbol
 
@@ -344,7 +488,8 @@ class BrokerInterface:
             Order status dict or None
         """
         if self.kite is None or self.dry_run:
-            return self.paper_orders.get(order_id)
+            order = self.paper_orders.get(order_id)
+            return self._paper_order_status(order) if order is not None else None
         else:
             try:
                 orders = self.kite.orders()
@@ -356,6 +501,42 @@ class BrokerInterface:
                 self.logger.error(f"Failed to get order status: {e}")
                 return None
 
+    def _paper_order_status(self, order: PaperOrder) -> Dict:
+        """
+        Rebuild the paper order result dict from the order book entry
+
+        Args:
+            order: Recorded paper order
+
+        Returns:
+            Order dict in the same layout place/close returned
+        """
+        status = {
+            'success': True,
+            'order_id': order.order_id,
+            'position_id': order.position_id,
+            'symbol': order.symbol,
+            'side': order.side,
+            'quantity': order.quantity,
+            'order_price': order.order_price,
+            'fill_price': order.fill_price,
+        }
+
+        if order.is_close:
+            status['slippage'] = order.order_price - order.fill_price
+            status['gross_pnl'] = order.gross_pnl
+            status['brokerage'] = order.brokerage
+            status['tax'] = order.tax
+            status['net_pnl'] = order.net_pnl
+        else:
+            status['slippage'] = order.fill_price - order.order_price
+            status['slippage_pct'] = self.config.execution_slippage_rate * 100
+            status['brokerage'] = order.brokerage
+
+        status['timestamp'] = order.timestamp
+        status['mode'] = 'PAPER'
+        return status
+
     def get_positions(self) -> List[Dict]:
         """
         Get current positions from broker
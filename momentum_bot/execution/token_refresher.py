@@ -5,12 +5,24 @@ Handles automatic token refresh when expired.
 Integrates with the main bot to maintain 24/7 operation.
 """
 
+import asyncio
+import math
 import os
 import logging
-from datetime import datetime, time
+import time as _time
+from datetime import datetime, time, timedelta
 from pathlib import Path
 import re
-from typing import Optional
+from typing import Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+_IST = ZoneInfo("Asia/Kolkata")
+
+# Exception text that marks an auth/token failure (worth a refresh)
+_TOK_ERR = re.compile(r'token|session|authentication|api_key', re.I)
+
+# KEY=value line in .env
+_ENV_LINE_RE = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*)=')
 
 
 class TokenRefresher:
@@ -24,6 +36,18 @@ class TokenRefresher:
     - Notifies via Telegram
     """
 
+    # Kite access tokens expire daily at 6:00 AM IST
+    TOKEN_EXPIRY_TIME = time(6, 0)
+    # Trust a successful profile() check for this long before probing again
+    VALIDATE_INTERVAL_S = 300.0
+    # Invalidation lands shortly after 6:00 with a tail to ~6:30; modelled as a
+    # normal truncated to the window (seconds after TOKEN_EXPIRY_TIME). A token
+    # obtained before 6 AM expires at 6 AM too, so probing starts at the expiry.
+    EXPIRY_MEAN_S = 300.0
+    EXPIRY_SD_S = 300.0
+    EXPIRY_WINDOW_S = 1800.0
+    EXPIRY_PROBES = 6
+
     def __init__(self, config):
         """
         Initialize token refresher
@@ -49,6 +73,102 @@ class TokenRefresher:
         else:
             self.logger.warning("⚠️  Auto-refresh disabled (add KITE_USERNAME, KITE_PASSWORD to .env)")
 
+        # Cached token state: expiry (epoch seconds) survives restarts via .env
+        self._token_expiry_ts: Optional[float] = None
+        expiry = os.getenv('KITE_ACCESS_TOKEN_EXPIRY')
+        if expiry:
+            try:
+                self._token_expiry_ts = datetime.fromisoformat(expiry).timestamp()
+            except ValueError:
+                self.logger.warning(f"Ignoring invalid KITE_ACCESS_TOKEN_EXPIRY: {expiry}")
+        self._last_validated: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        # Bumped on every successful refresh so the probe loop can tell a new
+        # token from an old one that simply hasn't been revoked yet
+        self._refresh_generation = 0
+
+        # .env kept in memory (lines plus key -> line index) and written only on change;
+        # the lock serialises concurrent refreshes
+        self._env_file = Path('.env')
+        self._env_lines: Optional[List[str]] = None
+        self._env_index: Dict[str, int] = {}
+        self._env_lock = asyncio.Lock()
+        self._load_env()
+        self._probe_offsets = self._expiry_probe_offsets(
+            self.EXPIRY_MEAN_S, self.EXPIRY_SD_S, self.EXPIRY_WINDOW_S, self.EXPIRY_PROBES
+        )
+
+    @staticmethod
+    def _expiry_probe_offsets(mean: float, sd: float, window: float, k: int) -> List[float]:
+        """
+        Probe times minimising expected detection delay for a known expiry density
+
+        With probes L_1 < ... < L_k (L_0 = 0), the optimum satisfies
+        L_{i+1} = L_i + (F(L_i) - F(L_{i-1})) / p(L_i); L_1 is found by
+        bisection so that the last probe lands at the end of the window.
+
+        Args:
+            mean: Mean invalidation offset in seconds
+            sd: Standard deviation in seconds
+            window: Window length in seconds (density truncated to [0, window])
+            k: Number of probes
+
+        Returns:
+            Sorted probe offsets in seconds after the nominal expiry
+        """
+        def cdf(t):
+            return 0.5 * (1 + math.erf((t - mean) / (sd * math.sqrt(2))))
+
+        z = cdf(window) - cdf(0.0)
+
+        def F(t):
+            return (cdf(t) - cdf(0.0)) / z
+
+        def p(t):
+            return math.exp(-0.5 * ((t - mean) / sd) ** 2) / (sd * math.sqrt(2 * math.pi) * z)
+
+        def sequence(first):
+            points = [0.0, first]
+            while len(points) <= k and points[-1] < window:
+                prev, cur = points[-2], points[-1]
+                points.append(cur + (F(cur) - F(prev)) / p(cur))
+            return points[1:]
+
+        lo, hi = 0.0, window
+        for _ in range(60):
+            mid = (lo + hi) / 2
+            if sequence(mid)[-1] >= window:
+                hi = mid
+            else:
+                lo = mid
+
+        offsets = [t for t in sequence(hi)[:k] if t < window]
+        return offsets[:k - 1] + [window]
+
+    def _next_expiry(self, now: Optional[datetime] = None) -> float:
+        """
+        Next daily token expiry after now
+
+        Args:
+            now: Reference time (default: current IST time)
+
+        Returns:
+            Expiry as epoch seconds
+        """
+        now = now or datetime.fromtimestamp(_time.time(), _IST)
+        expiry = datetime.combine(now.date(), self.TOKEN_EXPIRY_TIME, tzinfo=_IST)
+        if now >= expiry:
+            expiry += timedelta(days=1)
+        return expiry.timestamp()
+
+    def _token_fresh(self) -> bool:
+        """True if the token was validated recently and has not reached its expiry"""
+        if self._last_validated is None:
+            return False
+        if _time.monotonic() - self._last_validated >= self.VALIDATE_INTERVAL_S:
+            return False
+        return self._token_expiry_ts is None or _time.time() < self._token_expiry_ts
+
     def is_token_expired(self) -> bool:
         """
         Check if current token is expired
@@ -101,8 +221,11 @@ class TokenRefresher:
             self.logger.info("🔑 Generating access token...")
             access_token = exchange_request_token_for_access(creds, request_token)
 
-            # Save to .env
-            self._save_token_to_env(access_token)
+            # Cache the new token's expiry and save both to .env
+            self._token_expiry_ts = self._next_expiry()
+            self._last_validated = _time.monotonic()
+            self._refresh_generation += 1
+            await self._save_token_to_env(access_token, self._token_expiry_ts)
 
             self.logger.info("✅ Token refreshed successfully!")
 
@@ -116,84 +239,126 @@ class TokenRefresher:
             self.logger.error(f"Token refresh failed: {e}")
             return None
 
-    def _save_token_to_env(self, access_token: str):
+    def _load_env(self):
+        """Read .env once into memory"""
+        if not self._env_file.exists():
+            return
+
+        self._env_lines = self._env_file.read_text().splitlines()
+        for i, line in enumerate(self._env_lines):
+            m = _ENV_LINE_RE.match(line)
+            if m:
+                self._env_index[m.group(1)] = i
+
+    async def _save_token_to_env(self, access_token: str, expiry_ts: Optional[float] = None):
         """
-        Save access token to .env file
+        Save access token (and its expiry) to .env file
 
         Args:
             access_token: New access token
+            expiry_ts: Token expiry as epoch seconds (optional)
         """
-        env_file = Path('.env')
-
-        if not env_file.exists():
+        if self._env_lines is None:
             self.logger.error(".env file not found")
             return
 
-        # Read current content
-        with open(env_file, 'r') as f:
-            content = f.read()
-
-        # Update or add token
-        if 'KITE_ACCESS_TOKEN=' in content:
-            content = re.sub(
-                r'KITE_ACCESS_TOKEN=.*',
-                f'KITE_ACCESS_TOKEN={access_token}',
-                content
-            )
-        else:
-            if not content.endswith('\n'):
-                content += '\n'
-            content += f'KITE_ACCESS_TOKEN={access_token}\n'
-
-        # Write back
-        with open(env_file, 'w') as f:
-            f.write(content)
+        values = {'KITE_ACCESS_TOKEN': access_token}
+        if expiry_ts is not None:
+            values['KITE_ACCESS_TOKEN_EXPIRY'] = datetime.fromtimestamp(expiry_ts, _IST).isoformat()
+
+        async with self._env_lock:
+            # Update or add each key in the in-memory copy
+            changed = False
+            for key, value in values.items():
+                line = f'{key}={value}'
+                i = self._env_index.get(key)
+                if i is None:
+                    self._env_index[key] = len(self._env_lines)
+                    self._env_lines.append(line)
+                    changed = True
+                elif self._env_lines[i] != line:
+                    self._env_lines[i] = line
+                    changed = True
+
+            if changed:
+                # Write atomically so an interrupted refresh can't truncate .env
+                tmp_file = self._env_file.with_name(self._env_file.name + '.tmp')
+                tmp_file.write_text('\n'.join(self._env_lines) + '\n')
+                os.replace(tmp_file, self._env_file)
+
+            # Keep the process env in step so the token-present check sees it
+            os.environ['KITE_ACCESS_TOKEN'] = access_token
 
         self.logger.info("💾 Token saved to .env file")
 
+    def _in_market_hours(self) -> bool:
+        """True on weekdays between the configured market open and close (IST)"""
+        now = datetime.now(_IST)
+        if now.weekday() >= 5:
+            return False
+        return self.config.market_open_time <= now.time() <= self.config.market_close_time
+
     async def check_and_refresh_if_needed(self, kite_instance) -> bool:
         """
         Check token validity and refresh if needed
 
+        Validation is skipped outside market hours (nothing trades, so the
+        token is assumed fine). With no token set there is nothing to probe:
+        it is fetched straight away if auto-refresh is configured.
+
         Args:
             kite_instance: KiteConnect instance
 
         Returns:
             True if token is valid or successfully refreshed
         """
+        if not os.getenv('KITE_ACCESS_TOKEN'):
+            if self.can_auto_refresh:
+                self.logger.warning("⏰ No access token set - refreshing")
+                return await self._refresh_and_apply(kite_instance)
+            return False
+        if not self._in_market_hours():
+            return True
+
+        return await self._validate_and_refresh(kite_instance)
+
+    async def _validate_and_refresh(self, kite_instance) -> bool:
+        """
+        Validate the token via profile() and refresh it on a token error
+
+        Args:
+            kite_instance: KiteConnect instance
+
+        Returns:
+            True if token is valid or successfully refreshed
+        """
+        # Skip the profile() round-trip while the last validation is still fresh
+        if self._token_fresh():
+            return True
+
         try:
             # Try to make an API call
             profile = kite_instance.profile()
             self.logger.debug(f"Token valid for user: {profile.get('user_name')}")
+            self._last_validated = _time.monotonic()
+            # A missing expiry, or one whose invalidation window has fully passed
+            # (e.g. token regenerated by hand, which doesn't write
+            # KITE_ACCESS_TOKEN_EXPIRY), means this token is good until the next
+            # daily expiry. Inside the window it may just not be revoked yet, so
+            # the expiry is left for the probe loop.
+            if (self._token_expiry_ts is None
+                    or self._token_expiry_ts + self.EXPIRY_WINDOW_S <= _time.time()):
+                self._token_expiry_ts = self._next_expiry()
             return True
 
         except Exception as e:
-            error_msg = str(e).lower()
-
+            self._last_validated = None
             # Check if it's a token error
-            if 'token' in error_msg or 'session' in error_msg or 'authentication' in error_msg:
+            if _TOK_ERR.search(str(e)):
                 self.logger.warning(f"⏰ Token expired or invalid: {e}")
 
                 if self.can_auto_refresh:
-                    # Attempt refresh
-                    new_token = await self.refresh_token()
-
-                    if new_token:
-                        # Update kite instance
-                        kite_instance.set_access_token(new_token)
-
-                        # Update config (reload env)
-                        try:
-                            from dotenv import load_dotenv
-                            load_dotenv(override=True)
-                        except:
-                            pass
-
-                        self.logger.info("✅ Token refreshed and applied")
-                        return True
-                    else:
-                        self.logger.error("❌ Token refresh failed")
-                        return False
+                    return await self._refresh_and_apply(kite_instance)
                 else:
                     self.logger.error("❌ Token expired but auto-refresh not configured")
                     self.logger.error("   Run: python kite_token_generator.py")
@@ -203,6 +368,87 @@ class TokenRefresher:
                 self.logger.error(f"API error (not token-related): {e}")
                 return False
 
+    async def _refresh_and_apply(self, kite_instance) -> bool:
+        """
+        Refresh the token and apply it to the kite instance and environment
+
+        Args:
+            kite_instance: KiteConnect instance
+
+        Returns:
+            True if a new token was obtained
+        """
+        new_token = await self.refresh_token()
+
+        if new_token:
+            # Update kite instance
+            kite_instance.set_access_token(new_token)
+
+            # Update config (reload env)
+            try:
+                from dotenv import load_dotenv
+                load_dotenv(override=True)
+            except:
+                pass
+
+            self.logger.info("✅ Token refreshed and applied")
+            return True
+        else:
+            self.logger.error("❌ Token refresh failed")
+            return False
+
+    def start_auto_refresh(self, kite_instance):
+        """
+        Schedule refreshes at each daily expiry instead of waiting for a failed call
+
+        Must be called from a running event loop.
+
+        Args:
+            kite_instance: KiteConnect instance to update with new tokens
+        """
+        if not self.can_auto_refresh or self._refresh_task is not None:
+            return
+        self._refresh_task = asyncio.create_task(self._auto_refresh_loop(kite_instance))
+
+    def stop_auto_refresh(self):
+        """Cancel the scheduled refresh task"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    async def _auto_refresh_loop(self, kite_instance):
+        """Probe the token at the precomputed times after each expiry; refresh once it fails"""
+        expiry = self._token_expiry_ts
+        if expiry is None or expiry + self.EXPIRY_WINDOW_S <= _time.time():
+            # Unknown or long-gone expiry: start from the next one
+            expiry = self._next_expiry()
+
+        while True:
+            generation = self._refresh_generation
+
+            for offset in self._probe_offsets:
+                await asyncio.sleep(max(0.0, expiry + offset - _time.time()))
+                # A refresh (reactive or from the previous probe) means a new token
+                if self._refresh_generation != generation:
+                    break
+                self._last_validated = None
+                await self._validate_and_refresh(kite_instance)
+                if self._refresh_generation != generation:
+                    break
+
+            # Still the old token after the window: refresh regardless
+            while self._refresh_generation == generation:
+                self._last_validated = None
+                new_token = await self.refresh_token()
+                if new_token:
+                    kite_instance.set_access_token(new_token)
+                    self.logger.info("✅ Scheduled token refresh applied")
+                else:
+                    self.logger.error("❌ Scheduled token refresh failed - retrying")
+                    await asyncio.sleep(self.VALIDATE_INTERVAL_S)
+
+            expiry = self._token_expiry_ts
+
     def get_manual_refresh_instructions(self) -> str:
         """
         Get instructions for manual token refresh
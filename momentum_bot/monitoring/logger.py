@@ -4,11 +4,28 @@ Trade Logger for MCH Bot 3.0
 Logs all trading activities to file for analysis
 """
 
+import asyncio
+import atexit
 import logging
+import logging.handlers
 import json
-from datetime import datetime
+import os
+import queue
+import time
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
+
+try:
+    import orjson
+
+    def _dumps_line(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    orjson = None
+
+    def _dumps_line(obj) -> bytes:
+        return (json.dumps(obj, separators=(',', ':')) + '\n').encode('utf-8')
 
 
 class TradeLogger:
@@ -23,6 +40,14 @@ class TradeLogger:
     - Risk events
     """
 
+    # Trade log buffering: records are flushed in batches rather than one
+    # open/write/close per event
+    TRADE_LOG_BUFFER = 65536
+    FLUSH_EVERY = 32
+    FLUSH_INTERVAL_S = 5.0
+    # Records queued for the writer task when logging from the event loop
+    TRADE_QUEUE_SIZE = 1024
+
     def __init__(self, config):
         """
         Initialize trade logger
@@ -36,9 +61,19 @@ class TradeLogger:
         self.logs_dir = Path('logs')
         self.logs_dir.mkdir(exist_ok=True)
 
-        # Setup file handlers
-        self.trade_log_file = self.logs_dir / f"trades_{datetime.now().strftime('%Y%m%d')}.jsonl"
-        self.system_log_file = self.logs_dir / f"system_{datetime.now().strftime('%Y%m%d')}.log"
+        # Setup file handlers (one clock read and date stamp for both names)
+        now = datetime.now()
+        self._current_day = now.date()
+        self.trade_log_file = self._trade_log_path(self._current_day)
+        self.system_log_file = self.logs_dir / f"system_{now.strftime('%Y%m%d')}.log"
+
+        # Long-lived buffered handle for the trade journal
+        self._trade_fp = open(self.trade_log_file, 'ab', buffering=self.TRADE_LOG_BUFFER)
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._trade_q: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
+        atexit.register(self.close)
 
         # Configure logging
         self._setup_logging()
@@ -46,16 +81,35 @@ class TradeLogger:
         self.logger = logging.getLogger(__name__)
         self.logger.info("TradeLogger initialized")
 
+    def _trade_log_path(self, day: date) -> Path:
+        """Date-stamped trade journal path for a day"""
+        return self.logs_dir / f"trades_{day.strftime('%Y%m%d')}.jsonl"
+
     def _setup_logging(self):
-        """Setup logging configuration"""
-        # Root logger
+        """
+        Setup logging configuration
+
+        The root logger only enqueues records; a QueueListener thread owns the
+        file and console handlers, so log calls never block the event loop on I/O.
+        """
+        formatter = logging.Formatter('%(asctime)s | %(name)s | %(levelname)s | %(message)s')
+        file_handler = logging.FileHandler(self.system_log_file, encoding='utf-8')
+        stream_handler = logging.StreamHandler()
+        file_handler.setFormatter(formatter)
+        stream_handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, stream_handler, respect_handler_level=True
+        )
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+
+        # Root logger (the listener's handlers apply the real format)
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s | %(name)s | %(levelname)s | %(message)s',
-            handlers=[
-                logging.FileHandler(self.system_log_file, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
+            format='%(message)s',
+            handlers=[logging.handlers.QueueHandler(log_queue)]
         )
 
     def log_entry(self, position: Dict, order_result: Dict):
@@ -63,55 +117,57 @@ class TradeLogger:
         Log position entry
 
         Args:
-            position: Position dict
-            order_result: Order result dict
+            position: Position dict (as created by PositionManager)
+            order_result: Successful order result dict
         """
+        now = datetime.now()
         log_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'event': 'ENTRY',
-            'position_id': position.get('position_id'),
-            'instrument': position.get('instrument'),
-            'strike': position.get('strike'),
-            'expiry': position.get('expiry_str'),
-            'option_type': position.get('option_type'),
-            'quantity': position.get('quantity'),
-            'entry_premium': position.get('entry_premium'),
-            'entry_spot': position.get('entry_spot'),
-            'dte': position.get('dte'),
-            'confidence': position.get('confidence'),
-            'order_id': order_result.get('order_id'),
+            'position_id': position['position_id'],
+            'instrument': position['instrument'],
+            'strike': position['strike'],
+            'expiry': position['expiry_str'],
+            'option_type': position['option_type'],
+            'quantity': position['quantity'],
+            'entry_premium': position['entry_premium'],
+            'entry_spot': position['entry_spot'],
+            'dte': position['dte'],
+            'confidence': position['confidence'],
+            'order_id': order_result['order_id'],
             'fill_price': order_result.get('fill_price'),
-            'mode': order_result.get('mode')
+            'mode': order_result['mode']
         }
 
-        self._write_trade_log(log_entry)
+        self._write_trade_log(log_entry, now)
 
     def log_exit(self, position: Dict, exit_result: Dict, reason: str):
         """
         Log position exit
 
         Args:
-            position: Position dict
-            exit_result: Exit result dict
+            position: Position dict (as created by PositionManager)
+            exit_result: Exit result dict from PositionManager.exit_position
             reason: Exit reason
         """
+        now = datetime.now()
         log_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'event': 'EXIT',
-            'position_id': position.get('position_id'),
-            'instrument': position.get('instrument'),
-            'strike': position.get('strike'),
-            'option_type': position.get('option_type'),
-            'quantity': exit_result.get('exit_quantity'),
-            'entry_premium': position.get('entry_premium'),
-            'exit_premium': exit_result.get('exit_premium'),
-            'pnl': exit_result.get('pnl'),
+            'position_id': position['position_id'],
+            'instrument': position['instrument'],
+            'strike': position['strike'],
+            'option_type': position['option_type'],
+            'quantity': exit_result['exit_quantity'],
+            'entry_premium': position['entry_premium'],
+            'exit_premium': exit_result['exit_premium'],
+            'pnl': exit_result['pnl'],
             'return_pct': exit_result.get('return_pct'),
             'reason': reason,
             'order_id': exit_result.get('order_id')
         }
 
-        self._write_trade_log(log_entry)
+        self._write_trade_log(log_entry, now)
 
     def log_regime_change(self, old_regime: str, new_regime: str, confidence: float):
         """
@@ -122,22 +178,107 @@ class TradeLogger:
             new_regime: New regime
             confidence: Regime confidence
         """
+        now = datetime.now()
         log_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'event': 'REGIME_CHANGE',
             'old_regime': old_regime,
             'new_regime': new_regime,
             'confidence': confidence
         }
 
-        self._write_trade_log(log_entry)
+        self._write_trade_log(log_entry, now)
 
-    def _write_trade_log(self, log_entry: Dict):
+    def _write_trade_log(self, log_entry: Dict, now: datetime):
         """
         Write log entry to JSONL file
 
+        Inside the event loop the entry is only queued; a single writer task
+        serialises and writes it. Without a running loop it is written inline.
+
         Args:
             log_entry: Log entry dict
+            now: Event time (rolls the journal over to a new file after midnight)
         """
-        with open(self.trade_log_file, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_record(log_entry, now)
+            mono = time.monotonic()
+            if self._pending >= self.FLUSH_EVERY or mono - self._last_flush >= self.FLUSH_INTERVAL_S:
+                self.flush()
+            return
+
+        if self._drain_task is None or self._drain_task.done() or self._drain_task.get_loop() is not loop:
+            # First use, or a new loop: write anything a previous loop left behind
+            self._drain_queue()
+            self._trade_q = asyncio.Queue(maxsize=self.TRADE_QUEUE_SIZE)
+            self._drain_task = loop.create_task(self._drain())
+
+        try:
+            self._trade_q.put_nowait((log_entry, now))
+        except asyncio.QueueFull:
+            # Never drop a trade record
+            self._write_record(log_entry, now)
+
+    def _write_record(self, log_entry: Dict, now: datetime):
+        """Serialise one record into the buffered journal"""
+        if now.date() != self._current_day:
+            self._rotate(now.date())
+
+        self._trade_fp.write(_dumps_line(log_entry))
+        self._pending += 1
+
+    async def _drain(self):
+        """Writer task: write each burst of queued records, then flush off the loop"""
+        q = self._trade_q
+        while True:
+            log_entry, now = await q.get()
+            self._write_record(log_entry, now)
+            while not q.empty():
+                log_entry, now = q.get_nowait()
+                self._write_record(log_entry, now)
+
+            await asyncio.to_thread(self.flush)
+
+    def _drain_queue(self):
+        """Write any still-queued records inline"""
+        if self._trade_q is None:
+            return
+        while not self._trade_q.empty():
+            log_entry, now = self._trade_q.get_nowait()
+            self._write_record(log_entry, now)
+
+    def _rotate(self, day: date):
+        """Close the current journal and continue in the file for a new day"""
+        self._close_file()
+        self._current_day = day
+        self.trade_log_file = self._trade_log_path(day)
+        self._trade_fp = open(self.trade_log_file, 'ab', buffering=self.TRADE_LOG_BUFFER)
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        """Flush buffered trade log records to the OS"""
+        if self._trade_fp.closed:
+            return
+        self._trade_fp.flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        """Write queued records, then flush, fsync and close the trade log (safe to call more than once)"""
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+        if not self._trade_fp.closed:
+            self._drain_queue()
+        self._close_file()
+
+    def _close_file(self):
+        """Flush, fsync and close the current journal file"""
+        if self._trade_fp.closed:
+            return
+        self._trade_fp.flush()
+        os.fsync(self._trade_fp.fileno())
+        self._trade_fp.close()
@@ -8,11 +8,113 @@ Provides:
 - Performance summaries
 """
 
-from typing import Dict, Optional
+from collections import ChainMap
+from typing import Dict, List, Optional, Tuple
 import logging
 import asyncio
+import json
+import uuid
 from datetime import datetime
-import requests
+import aiohttp
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    orjson = None
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# Shared message frame pieces
+_SEP = '━' * 27
+
+_EMOJIS = {
+    'entry': '📈',
+    'exit': '💰',
+    'error': '⚠️',
+    'regime_change': '🔄',
+    'stop_loss': '🛑',
+    'profit': '✅',
+    'startup': '🚀',
+    'shutdown': '⏹️'
+}
+
+# Message templates: the fixed frame is built once, each send is one format_map
+_CONFIRM_TEMPLATE = (
+    "\n🔔 *TRADE CONFIRMATION REQUIRED*\n\n" + _SEP + "\n"
+    "📊 **Signal Details**\n"
+    "Direction: {direction}\n"
+    "Spot: ₹{spot:,.0f}\n"
+    "Confidence: {confidence:.0f}/100\n\n"
+    "⏰ Timestamp: {timestamp:%H:%M:%S}\n\n" + _SEP + "\n"
+    "Tap ✅ Confirm to execute or ❌ Reject to skip\n\n"
+    "⏳ Auto-reject in 60 seconds\n"
+)
+
+_OPENED_TEMPLATE = (
+    "\n📈 *POSITION OPENED*\n\n" + _SEP + "\n"
+    "**{instrument} {strike} {option_type}**\n\n"
+    "Quantity: {quantity} ({lots} lots)\n"
+    "Entry: ₹{entry_premium:.2f}\n"
+    "DTE: {dte} days\n"
+    "Confidence: {confidence:.0f}/100\n\n"
+    "Stop Loss: ₹{stop_loss:.2f}\n"
+    "Target: +75% (₹{target:.2f})\n\n"
+    "Mode: {mode}\n"
+    "Order ID: {order_id}\n\n" + _SEP + "\n"
+)
+
+_OPENED_DEFAULTS = {'mode': 'UNKNOWN', 'order_id': 'N/A', 'lots': '-', 'dte': '-', 'confidence': 0}
+
+_CLOSED_TEMPLATE = (
+    "\n{pnl_emoji} *POSITION CLOSED*\n\n" + _SEP + "\n"
+    "**{instrument} {strike} {option_type}**\n\n"
+    "Entry: ₹{entry_premium:.2f}\n"
+    "Exit: ₹{exit_premium:.2f}\n"
+    "Quantity: {exit_quantity}\n\n"
+    "**P&L: ₹{pnl:,.0f}** ({return_pct:+.1f}%)\n\n"
+    "Hold Time: {hold_time}\n"
+    "Reason: {reason}\n\n" + _SEP + "\n"
+)
+
+_CLOSED_DEFAULTS = {'exit_premium': 0, 'exit_quantity': 0}
+
+_SUMMARY_TEMPLATE = (
+    "\n📊 *DAILY SUMMARY*\n\n" + _SEP + "\n"
+    "Trades: {trades}\n"
+    "Winners: {winners} ✅\n"
+    "Losers: {losers} ❌\n\n"
+    "Win Rate: {win_rate:.1f}%\n\n"
+    "**Total P&L: ₹{total_pnl:,.0f}**\n\n" + _SEP + "\n"
+)
+_SUMMARY_DEFAULTS = {'trades': 0, 'winners': 0, 'losers': 0, 'win_rate': 0, 'total_pnl': 0}
+
+_REGIME_TEMPLATE = (
+    "\n🔄 *REGIME CHANGE*\n\n" + _SEP + "\n"
+    "{old_regime} ➜ **{new_regime}**\n\n"
+    "{reason}\n\n" + _SEP + "\n"
+)
+
+_RISK_TEMPLATE = (
+    "\n🛑 *RISK ALERT: {alert_type}*\n\n" + _SEP + "\n"
+    "{message}\n\n" + _SEP + "\n"
+)
+
+_STATUS_TEMPLATE = (
+    "\n📊 *BOT STATUS*\n\n" + _SEP + "\n"
+    "**Regime:** {regime}\n"
+    "**Active Bot:** {active_bot}\n\n"
+    "**Positions:** {active_positions}/{max_positions}\n"
+    "**Available Capital:** ₹{available_capital:,.0f}\n\n"
+    "**Daily Loss:** ₹{daily_loss:,.0f}/{daily_limit:,}\n"
+    "**Weekly Loss:** ₹{weekly_loss:,.0f}/{weekly_limit:,}\n\n"
+    "Mode: {mode}\n" + _SEP + "\n"
+)
+_STATUS_DEFAULTS = {
+    'regime': 'Unknown', 'active_bot': 'None', 'active_positions': 0, 'max_positions': 2,
+    'available_capital': 0, 'daily_loss': 0, 'daily_limit': 0, 'weekly_loss': 0, 'weekly_limit': 0
+}
 
 
 class TelegramBot:
@@ -25,6 +127,18 @@ class TelegramBot:
     - MANUAL: All trades manual (bot suggests only)
     """
 
+    CONFIRM_TIMEOUT_S = 60
+    # getUpdates long-poll timeout (Telegram holds the request open this long)
+    UPDATES_POLL_S = 30
+
+    # Alert coalescing: queued messages are joined into one sendMessage after
+    # COALESCE_WINDOW_S or once COALESCE_MAX are waiting
+    COALESCE_WINDOW_S = 0.5
+    COALESCE_MAX = 4
+    COALESCE_JOINER = "\n\n---\n\n"
+    MAX_MESSAGE_LEN = 4096
+    URGENT_ALERTS = frozenset({'error', 'stop_loss'})
+
     def __init__(self, config):
         """
         Initialize Telegram bot
@@ -39,81 +153,197 @@ class TelegramBot:
         self.chat_id = config.telegram_chat_id
         self.mode = config.telegram_override_mode
 
+        # Pooled HTTP session, created on first send (it must belong to the running loop)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._api_url = f"https://api.telegram.org/bot{self.bot_token}"
+        self._send_url = f"{self._api_url}/sendMessage"
+
+        # CONFIRM mode: pending confirmations by correlation id, answered by the
+        # getUpdates long-poll task
+        self._pending: Dict[str, asyncio.Event] = {}
+        self._results: Dict[str, bool] = {}
+        self._updates_task: Optional[asyncio.Task] = None
+        self._update_offset = 0
+
+        # Outgoing alert queue drained by the coalescing flush task
+        self._alert_q: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Credentials are verified lazily (getMe on first send), not at construction
+        self._verify_task: Optional[asyncio.Task] = None
+
         # Initialize bot if credentials provided
         if self.bot_token and self.chat_id:
-            self._init_bot()
+            self.bot = True
         else:
             self.bot = None
             self.logger.warning("Telegram credentials not configured - notifications disabled")
 
+        # Fixed after init: lets every send_* return before building its message
+        self._enabled = self.bot is not None
+
         self.logger.info(f"TelegramBot initialized: Mode={self.mode}")
 
-    def _init_bot(self):
-        """Initialize Telegram bot"""
+    async def _verify(self):
+        """Check the bot token with getMe and disable sends if Telegram rejects it"""
         try:
-            # Test connection with a simple API call
-            url = f"https://api.telegram.org/bot{self.bot_token}/getMe"
-            response = requests.get(url, timeout=10)
-
-            if response.status_code == 200:
-                bot_info = response.json()
-                if bot_info.get('ok'):
-                    self.logger.info(f"Telegram bot initialized: @{bot_info['result'].get('username')}")
-                    self.bot = True  # Mark as initialized
-                else:
+            async with self._get_session().get(f"{self._api_url}/getMe") as response:
+                if response.status == 200:
+                    bot_info = await response.json()
+                    if bot_info.get('ok'):
+                        self.logger.info(f"Telegram bot initialized: @{bot_info['result'].get('username')}")
+                        return
                     self.logger.error(f"Telegram bot error: {bot_info}")
+                else:
+                    self.logger.error(f"Telegram API error: {response.status}")
+
+                if response.status in (401, 404):
+                    # Bad token: further sends would fail the same way
                     self.bot = None
-            else:
-                self.logger.error(f"Telegram API error: {response.status_code}")
-                self.bot = None
+                    self._enabled = False
 
         except Exception as e:
             self.logger.error(f"Failed to initialize Telegram bot: {e}")
-            self.bot = None
 
-    async def send_message(self, message: str, parse_mode: str = 'Markdown'):
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the keep-alive session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=300),
+                timeout=aiohttp.ClientTimeout(total=10),
+                # Bodies are pre-encoded with _dumps and posted as data=
+                headers={'Content-Type': 'application/json'}
+            )
+        return self._session
+
+    async def close(self):
+        """Deliver queued alerts, stop background tasks and close the HTTP session"""
+        if self._flush_task is not None and not self._flush_task.done():
+            # Sentinel: the flush task sends what it holds and exits
+            self._alert_q.put_nowait(None)
+            await self._flush_task
+        self._flush_task = None
+        for task in (self._updates_task, self._verify_task):
+            if task is not None:
+                task.cancel()
+        self._updates_task = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def send_message(self, message: str, parse_mode: str = 'Markdown',
+                           reply_markup: Optional[Dict] = None, urgent: bool = False):
         """
         Send message to Telegram
 
+        Plain messages are queued and coalesced with others sent in the same
+        burst; urgent messages and ones with reply markup go out immediately.
+
         Args:
             message: Message text
             parse_mode: Parse mode ('Markdown' or 'HTML')
+            reply_markup: Optional reply markup (e.g. inline keyboard)
+            urgent: Bypass the coalescing queue
 
         Returns:
-            Success status
+            Success status (True once queued for coalesced messages)
         """
-        if self.bot is None:
-            self.logger.debug(f"[Telegram disabled] {message}")
+        if not self._enabled:
             return False
 
-        try:
-            # Use requests instead of python-telegram-bot for simpler async handling
-            url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
+        if self._verify_task is None:
+            self._verify_task = asyncio.create_task(self._verify())
+
+        if urgent or reply_markup is not None:
+            return await self._post_message(message, parse_mode, reply_markup)
+
+        if self._alert_q is None:
+            self._alert_q = asyncio.Queue()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        self._alert_q.put_nowait((message, parse_mode))
+        return True
+
+    async def _flush_loop(self):
+        """Collect queued messages for up to COALESCE_WINDOW_S and send them together"""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._alert_q.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = loop.time() + self.COALESCE_WINDOW_S
+            while len(batch) < self.COALESCE_MAX:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._alert_q.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    await self._send_batch(batch)
+                    return
+                batch.append(item)
+            await self._send_batch(batch)
+
+    async def _send_batch(self, batch: List[Tuple[str, str]]):
+        """
+        Send queued messages as few sendMessage calls as possible
+
+        Consecutive messages with the same parse mode are joined while the
+        result stays within Telegram's message length limit.
+
+        Args:
+            batch: List of (message, parse_mode)
+        """
+        text, mode = None, None
+        for message, parse_mode in batch:
+            if text is not None and parse_mode == mode and \
+                    len(text) + len(self.COALESCE_JOINER) + len(message) <= self.MAX_MESSAGE_LEN:
+                text += self.COALESCE_JOINER + message
+                continue
+            if text is not None:
+                await self._post_message(text, mode)
+            text, mode = message, parse_mode
+        if text is not None:
+            await self._post_message(text, mode)
+
+    async def _post_message(self, message: str, parse_mode: str = 'Markdown',
+                            reply_markup: Optional[Dict] = None) -> bool:
+        """
+        POST a single sendMessage request
+
+        Args:
+            message: Message text
+            parse_mode: Parse mode ('Markdown' or 'HTML')
+            reply_markup: Optional reply markup
 
+        Returns:
+            Success status
+        """
+        try:
             payload = {
                 'chat_id': self.chat_id,
                 'text': message,
                 'parse_mode': parse_mode
             }
-
-            # Run in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.post(url, json=payload, timeout=10)
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                if result.get('ok'):
-                    self.logger.debug("Telegram message sent successfully")
-                    return True
+            if reply_markup is not None:
+                payload['reply_markup'] = reply_markup
+
+            # One pooled connection to api.telegram.org, reused across sends
+            async with self._get_session().post(self._send_url, data=_dumps(payload)) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    if result.get('ok'):
+                        self.logger.debug("Telegram message sent successfully")
+                        return True
+                    else:
+                        self.logger.error(f"Telegram API error: {result}")
+                        return False
                 else:
-                    self.logger.error(f"Telegram API error: {result}")
+                    self.logger.error(f"Telegram HTTP error: {response.status}")
                     return False
-            else:
-                self.logger.error(f"Telegram HTTP error: {response.status_code}")
-                return False
 
         except Exception as e:
             self.logger.error(f"Failed to send Telegram message: {e}")
@@ -128,25 +358,13 @@ class TelegramBot:
             message: Alert message
         """
         # Quick return if Telegram not configured
-        if self.bot is None:
-            self.logger.debug(f"[Telegram disabled] {alert_type}: {message}")
+        if not self._enabled:
             return
 
-        emojis = {
-            'entry': '📈',
-            'exit': '💰',
-            'error': '⚠️',
-            'regime_change': '🔄',
-            'stop_loss': '🛑',
-            'profit': '✅',
-            'startup': '🚀',
-            'shutdown': '⏹️'
-        }
-
-        emoji = emojis.get(alert_type, '📊')
+        emoji = _EMOJIS.get(alert_type, '📊')
         formatted_message = f"{emoji} *{alert_type.upper()}*\n\n{message}"
 
-        await self.send_message(formatted_message)
+        await self.send_message(formatted_message, urgent=alert_type in self.URGENT_ALERTS)
 
     async def request_confirmation(self, signal_data: Dict) -> bool:
         """
@@ -163,24 +381,99 @@ class TelegramBot:
             return self.mode == 'AUTO'
 
         # If Telegram not configured, return False (reject trade)
-        if self.bot is None:
+        if not self._enabled:
             self.logger.warning("Telegram not configured - rejecting trade (CONFIRM mode requires Telegram)")
             return False
 
-        # Format confirmation request
+        # Format confirmation request with inline buttons carrying a correlation id
+        cid = uuid.uuid4().hex[:12]
         message = self._format_confirmation_request(signal_data)
+        keyboard = {'inline_keyboard': [[
+            {'text': '✅ Confirm', 'callback_data': f"conf:{cid}"},
+            {'text': '❌ Reject', 'callback_data': f"rej:{cid}"}
+        ]]}
 
-        await self.send_message(message)
+        event = asyncio.Event()
+        self._pending[cid] = event
+        try:
+            if not await self.send_message(message, reply_markup=keyboard):
+                self.logger.warning("Confirmation request not delivered - rejecting trade")
+                return False
+
+            if self._updates_task is None or self._updates_task.done():
+                self._updates_task = asyncio.create_task(self._poll_updates())
+
+            self.logger.info("⏳ Waiting for manual confirmation...")
+            try:
+                await asyncio.wait_for(event.wait(), timeout=self.CONFIRM_TIMEOUT_S)
+            except asyncio.TimeoutError:
+                self.logger.warning("⏰ Confirmation timeout - auto-rejecting")
+                return False
+
+            approved = self._results.get(cid, False)
+            self.logger.info(f"Manual confirmation: {'CONFIRMED' if approved else 'REJECTED'}")
+            return approved
+
+        finally:
+            self._pending.pop(cid, None)
+            self._results.pop(cid, None)
+
+    async def _poll_updates(self):
+        """
+        Long-poll getUpdates while confirmations are pending
+
+        Button presses arrive as callback queries whose data is
+        "conf:<id>" or "rej:<id>"; each one wakes the matching waiter.
+        """
+        url = f"{self._api_url}/getUpdates"
+        timeout = aiohttp.ClientTimeout(total=self.UPDATES_POLL_S + 10)
+
+        while self._pending:
+            params = {
+                'offset': self._update_offset,
+                'timeout': self.UPDATES_POLL_S,
+                'allowed_updates': '["callback_query"]'
+            }
+            try:
+                async with self._get_session().get(url, params=params, timeout=timeout) as response:
+                    result = await response.json()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Telegram getUpdates failed: {e}")
+                await asyncio.sleep(1)
+                continue
+
+            for update in result.get('result', []):
+                self._update_offset = update['update_id'] + 1
+                query = update.get('callback_query')
+                if query is not None:
+                    await self._handle_callback(query)
+
+    async def _handle_callback(self, query: Dict):
+        """
+        Resolve a pending confirmation from an inline button press
 
-        # Wait for user response (simplified - in production use callback buttons)
-        self.logger.info("⏳ Waiting for manual confirmation...")
+        Args:
+            query: Telegram callback_query object
+        """
+        chat_id = query.get('message', {}).get('chat', {}).get('id')
+        action, _, cid = query.get('data', '').partition(':')
+        event = self._pending.get(cid)
 
-        # For now, auto-approve after 60 seconds (timeout)
-        # In production, implement proper callback handling
-        await asyncio.sleep(60)
+        if event is not None and str(chat_id) == str(self.chat_id) and action in ('conf', 'rej'):
+            self._results[cid] = action == 'conf'
+            event.set()
 
-        self.logger.warning("⏰ Confirmation timeout - auto-rejecting")
-        return False
+        # Acknowledge so the client stops showing a spinner
+        try:
+            async with self._get_session().post(
+                f"{self._api_url}/answerCallbackQuery",
+                data=_dumps({'callback_query_id': query['id']})
+            ):
+                pass
+        except Exception as e:
+            self.logger.debug(f"answerCallbackQuery failed: {e}")
 
     def _format_confirmation_request(self, signal_data: Dict) -> str:
         """
@@ -192,29 +485,7 @@ class TelegramBot:
         Returns:
             Formatted message
         """
-        direction = signal_data['direction']
-        spot = signal_data['spot']
-        confidence = signal_data['confidence']
-
-        message = f"""
-🔔 *TRADE CONFIRMATION REQUIRED*
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📊 **Signal Details**
-Direction: {direction}
-Spot: ₹{spot:,.0f}
-Confidence: {confidence:.0f}/100
-
-⏰ Timestamp: {signal_data['timestamp'].strftime('%H:%M:%S')}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Reply with:
-✅ /confirm - Execute trade
-❌ /reject - Skip trade
-
-⏳ Auto-reject in 60 seconds
-"""
-        return message
+        return _CONFIRM_TEMPLATE.format_map(signal_data)
 
     async def send_position_opened(self, position: Dict, order_result: Dict):
         """
@@ -224,25 +495,12 @@ Reply with:
             position: Position dict
             order_result: Order result dict
         """
-        message = f"""
-📈 *POSITION OPENED*
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━
-**{position['instrument']} {position['strike']} {position['option_type']}**
-
-Quantity: {position['quantity']} ({position['lots']} lots)
-Entry: ₹{position['entry_premium']:.2f}
-DTE: {position['dte']} days
-Confidence: {position['confidence']:.0f}/100
-
-Stop Loss: ₹{position['stop_loss']:.2f}
-Target: +75% (₹{position['entry_premium'] * 1.75:.2f})
-
-Mode: {order_result.get('mode', 'UNKNOWN')}
-Order ID: {order_result.get('order_id', 'N/A')}
+        if not self._enabled:
+            return
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+        message = _OPENED_TEMPLATE.format_map(
+            ChainMap({'target': position['entry_premium'] * 1.75}, position, order_result, _OPENED_DEFAULTS)
+        )
         await self.send_alert('entry', message)
 
     async def send_position_closed(
@@ -259,28 +517,18 @@ Order ID: {order_result.get('order_id', 'N/A')}
             exit_result: Exit result dict
             reason: Exit reason
         """
-        pnl = exit_result.get('pnl', 0)
-        return_pct = exit_result.get('return_pct', 0)
-
-        pnl_emoji = '✅' if pnl > 0 else '❌'
-
-        message = f"""
-{pnl_emoji} *POSITION CLOSED*
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━
-**{position['instrument']} {position['strike']} {position['option_type']}**
-
-Entry: ₹{position['entry_premium']:.2f}
-Exit: ₹{exit_result.get('exit_premium', 0):.2f}
-Quantity: {exit_result.get('exit_quantity', 0)}
-
-**P&L: ₹{pnl:,.0f}** ({return_pct:+.1f}%)
-
-Hold Time: {self._calculate_hold_time(position)}
-Reason: {reason}
+        if not self._enabled:
+            return
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+        pnl = exit_result.get('pnl', 0)
+        extra = {
+            'pnl': pnl,
+            'pnl_emoji': '✅' if pnl > 0 else '❌',
+            'return_pct': exit_result.get('return_pct', 0),
+            'hold_time': self._calculate_hold_time(position),
+            'reason': reason
+        }
+        message = _CLOSED_TEMPLATE.format_map(ChainMap(extra, exit_result, position, _CLOSED_DEFAULTS))
         alert_type = 'profit' if pnl > 0 else 'stop_loss'
         await self.send_alert(alert_type, message)
 
@@ -296,20 +544,10 @@ Reason: {reason}
                 - total_pnl: Total P&L
                 - win_rate: Win rate percentage
         """
-        message = f"""
-📊 *DAILY SUMMARY*
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Trades: {summary.get('trades', 0)}
-Winners: {summary.get('winners', 0)} ✅
-Losers: {summary.get('losers', 0)} ❌
-
-Win Rate: {summary.get('win_rate', 0):.1f}%
-
-**Total P&L: ₹{summary.get('total_pnl', 0):,.0f}**
+        if not self._enabled:
+            return
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+        message = _SUMMARY_TEMPLATE.format_map(ChainMap(summary, _SUMMARY_DEFAULTS))
         await self.send_message(message)
 
     async def send_regime_change(self, old_regime: str, new_regime: str, reason: str):
@@ -321,16 +559,10 @@ Win Rate: {summary.get('win_rate', 0):.1f}%
             new_regime: New regime
             reason: Change reason
         """
-        message = f"""
-🔄 *REGIME CHANGE*
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━
-{old_regime or 'None'} ➜ **{new_regime}**
-
-{reason}
+        if not self._enabled:
+            return
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+        message = _REGIME_TEMPLATE.format(old_regime=old_regime or 'None', new_regime=new_regime, reason=reason)
         await self.send_alert('regime_change', message)
 
     async def send_risk_alert(self, alert_type: str, message: str):
@@ -341,14 +573,10 @@ Win Rate: {summary.get('win_rate', 0):.1f}%
             alert_type: Alert type
             message: Alert message
         """
-        formatted = f"""
-🛑 *RISK ALERT: {alert_type.upper()}*
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━
-{message}
+        if not self._enabled:
+            return
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+        formatted = _RISK_TEMPLATE.format(alert_type=alert_type.upper(), message=message)
         await self.send_alert('error', formatted)
 
     async def send_status_update(self, status: Dict):
@@ -358,22 +586,10 @@ Win Rate: {summary.get('win_rate', 0):.1f}%
         Args:
             status: Status dict
         """
-        message = f"""
-📊 *BOT STATUS*
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━
-**Regime:** {status.get('regime', 'Unknown')}
-**Active Bot:** {status.get('active_bot', 'None')}
-
-**Positions:** {status.get('active_positions', 0)}/{status.get('max_positions', 2)}
-**Available Capital:** ₹{status.get('available_capital', 0):,.0f}
-
-**Daily Loss:** ₹{status.get('daily_loss', 0):,.0f}/{status.get('daily_limit', 0):,}
-**Weekly Loss:** ₹{status.get('weekly_loss', 0):,.0f}/{status.get('weekly_limit', 0):,}
+        if not self._enabled:
+            return
 
-Mode: {self.mode}
-━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+        message = _STATUS_TEMPLATE.format_map(ChainMap({'mode': self.mode}, status, _STATUS_DEFAULTS))
         await self.send_message(message)
 
     def _calculate_hold_time(self, position: Dict) -> str:
@@ -386,16 +602,21 @@ Mode: {self.mode}
         Returns:
             Formatted hold time string
         """
-        entry_time = position.get('entry_time', datetime.now())
-        exit_time = position.get('exit_time', datetime.now())
-
-        delta = exit_time - entry_time
-
-        hours = delta.seconds // 3600
-        minutes = (delta.seconds % 3600) // 60
-
-        if delta.days > 0:
-            return f"{delta.days}d {hours}h {minutes}m"
+        entry_time = position.get('entry_time')
+        exit_time = position.get('exit_time')
+        if entry_time is None or exit_time is None:
+            # One clock read for whichever end is missing
+            now = datetime.now()
+            entry_time = entry_time or now
+            exit_time = exit_time or now
+
+        total = int((exit_time - entry_time).total_seconds())
+        days, rem = divmod(total, 86400)
+        hours, rem = divmod(rem, 3600)
+        minutes = rem // 60
+
+        if days > 0:
+            return f"{days}d {hours}h {minutes}m"
         elif hours > 0:
             return f"{hours}h {minutes}m"
         else:
@@ -0,0 +1,118 @@
+"""
+Tests for the scheduled token refresh loop
+"""
+
+import asyncio
+import sys
+import types
+from datetime import datetime
+
+import pytest
+
+from momentum_bot.execution import token_refresher
+from momentum_bot.execution.token_refresher import TokenRefresher, _IST
+
+
+class _Stop(Exception):
+    """Ends the otherwise endless refresh loop"""
+
+
+class FakeClock:
+    """Stands in for the time module; sleeping just advances it"""
+
+    def __init__(self, start: float):
+        self.now = start
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class FakeKite:
+    """profile() succeeds until the token dies; set_access_token revives it"""
+
+    def __init__(self, clock: FakeClock, dies_at: float):
+        self.clock = clock
+        self.dies_at = dies_at
+        self.profile_calls = 0
+        self.tokens = []
+
+    def profile(self):
+        self.profile_calls += 1
+        if self.clock.now >= self.dies_at:
+            raise Exception("Incorrect `api_key` or `access_token`.")
+        return {'user_name': 'test'}
+
+    def set_access_token(self, token):
+        self.tokens.append((self.clock.now, token))
+        self.dies_at = float('inf')
+
+
+@pytest.fixture
+def clock(monkeypatch, tmp_path):
+    # No .env in the working directory, so refreshes are not written anywhere
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('KITE_USERNAME', 'user')
+    monkeypatch.setenv('KITE_PASSWORD', 'pass')
+    monkeypatch.delenv('KITE_ACCESS_TOKEN_EXPIRY', raising=False)
+
+    fake_clock = FakeClock(datetime(2026, 10, 16, 5, 0, tzinfo=_IST).timestamp())
+    monkeypatch.setattr(token_refresher, '_time', fake_clock)
+
+    # Login flow replaced so refresh_token() issues tokens without a browser
+    auth = types.ModuleType('mch_bot.auth.kite_auth')
+    auth.KiteCreds = types.SimpleNamespace
+    auth.login_and_get_request_token = lambda creds, timeout_ms=0: 'request'
+    auth.exchange_request_token_for_access = lambda creds, request_token: 'new_token'
+    monkeypatch.setitem(sys.modules, 'mch_bot.auth.kite_auth', auth)
+
+    return fake_clock
+
+
+def _run_loop(monkeypatch, refresher, kite, clock, until):
+    """Drive the refresh loop on the fake clock until it reaches ``until``"""
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay):
+        clock.now += delay
+        if clock.now >= until:
+            raise _Stop
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, 'sleep', fake_sleep)
+    with pytest.raises(_Stop):
+        asyncio.run(refresher._auto_refresh_loop(kite))
+
+
+def test_probe_after_surviving_first_probe_refreshes(monkeypatch, clock):
+    config = types.SimpleNamespace(kite_api_key='key', kite_api_secret='secret')
+    refresher = TokenRefresher(config)
+    expiry = datetime(2026, 10, 16, 6, 0, tzinfo=_IST).timestamp()
+    offsets = refresher._probe_offsets
+
+    # Token is still accepted at the first probe and dies a minute later
+    kite = FakeKite(clock, dies_at=expiry + offsets[0] + 60)
+    _run_loop(monkeypatch, refresher, kite, clock, until=expiry + refresher.EXPIRY_WINDOW_S + 3600)
+
+    assert kite.profile_calls == 2
+    assert len(kite.tokens) == 1
+    refreshed_at, _ = kite.tokens[0]
+    assert refreshed_at == pytest.approx(expiry + offsets[1])
+    assert refresher._token_expiry_ts == datetime(2026, 10, 17, 6, 0, tzinfo=_IST).timestamp()
+
+
+def test_token_surviving_window_is_refreshed_once(monkeypatch, clock):
+    config = types.SimpleNamespace(kite_api_key='key', kite_api_secret='secret')
+    refresher = TokenRefresher(config)
+    expiry = datetime(2026, 10, 16, 6, 0, tzinfo=_IST).timestamp()
+
+    # Never revoked: every probe passes and must not re-arm the expiry
+    kite = FakeKite(clock, dies_at=float('inf'))
+    _run_loop(monkeypatch, refresher, kite, clock, until=expiry + refresher.EXPIRY_WINDOW_S + 3600)
+
+    assert kite.profile_calls == len(refresher._probe_offsets)
+    assert len(kite.tokens) == 1
+    refreshed_at, _ = kite.tokens[0]
+    assert refreshed_at == pytest.approx(expiry + refresher.EXPIRY_WINDOW_S)